@@ -13,6 +13,7 @@ from datetime import datetime
 from pathlib import Path
 
 from evaluator.paths import get_data_dir
+from evaluator.utils.http_client import get_http_session
 
 
 class GiteeCollector:
@@ -373,7 +374,7 @@ class GiteeCollector:
         print(f"[API] Fetching commit data from {api_url}")
 
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 api_url,
                 headers=self._get_headers(),
                 params=self._get_params(url=api_url),
@@ -426,7 +427,7 @@ class GiteeCollector:
             base_params.update(kwargs)  # Add since/until/etc parameters
             params = self._get_params(base_params, url=api_url)
 
-            response = requests.get(
+            response = get_http_session().get(
                 api_url,
                 headers=self._get_headers(),
                 params=params,
@@ -615,7 +616,7 @@ class GiteeCollector:
             # Gitee API supports pagination
             params = self._get_params({"per_page": 100, "page": 1}, url=api_url)
 
-            response = requests.get(
+            response = get_http_session().get(
                 api_url,
                 headers=self._get_headers(),
                 params=params,
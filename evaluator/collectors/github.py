@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 from evaluator.paths import get_data_dir
+from evaluator.utils.http_client import get_http_session
 
 
 class GitHubCollector:
@@ -275,7 +276,7 @@ class GitHubCollector:
         print(f"[API] Fetching commit data from {api_url}")
 
         try:
-            response = requests.get(api_url, headers=self._get_headers(), timeout=30)
+            response = get_http_session().get(api_url, headers=self._get_headers(), timeout=30)
             response.raise_for_status()
 
             commit_data = response.json()
@@ -310,7 +311,7 @@ class GitHubCollector:
         print(f"[API] Fetching commits list from {api_url} with params: {params}")
 
         try:
-            response = requests.get(api_url, headers=self._get_headers(), params=params, timeout=30)
+            response = get_http_session().get(api_url, headers=self._get_headers(), params=params, timeout=30)
             response.raise_for_status()
 
             commits_list = response.json()
@@ -4,6 +4,12 @@ from evaluator.config.tokens import (
     get_github_token,
     get_gitee_token,
     get_llm_api_key,
+    get_llm_budget_usd,
+    get_llm_price_per_mtok,
+    get_eval_cache_ttl_seconds,
+    get_alias_concurrency,
+    get_llm_rate_limits,
+    get_llm_cache_policy,
     mask_secret,
     DEFAULT_LLM_MODEL,
 )
@@ -18,6 +24,12 @@ __all__ = [
     "get_github_token",
     "get_gitee_token",
     "get_llm_api_key",
+    "get_llm_budget_usd",
+    "get_llm_price_per_mtok",
+    "get_eval_cache_ttl_seconds",
+    "get_alias_concurrency",
+    "get_llm_rate_limits",
+    "get_llm_cache_policy",
     "mask_secret",
     "DEFAULT_LLM_MODEL",
     "get_user_env_path",
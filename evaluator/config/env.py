@@ -1,8 +1,10 @@
 """Environment variable and configuration file management."""
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from evaluator.paths import get_home_dir
 
@@ -12,21 +14,71 @@ def get_user_env_path() -> Path:
     return get_home_dir() / ".env.local"
 
 
-def parse_env_file(path: Path) -> Dict[str, str]:
-    """Parse .env file into dictionary."""
-    env: Dict[str, str] = {}
+@lru_cache(maxsize=8)
+def _parse_env_file_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    # mtime/size are part of the cache key so a rewritten file is re-parsed.
+    pairs: List[Tuple[str, str]] = []
     try:
-        for raw in path.read_text(encoding="utf-8").splitlines():
+        for raw in Path(path).read_text(encoding="utf-8").splitlines():
             line = raw.strip()
-            if not line or line.startswith("#") or "=" not in line:
+            if not line or line[0] == "#":
                 continue
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
-    except FileNotFoundError:
-        return {}
+            k, sep, v = line.partition("=")
+            if sep:
+                pairs.append((k.rstrip(), v.lstrip()))
     except Exception:
-        return env
-    return env
+        pass
+    return tuple(pairs)
+
+
+def parse_env_file(path: Path) -> Dict[str, str]:
+    """Parse .env file into dictionary (a fresh dict; callers may modify it)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    return dict(_parse_env_file_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+# Keys written first, in this order; any others follow sorted by name.
+_ENV_KEY_ORDER = (
+    "GITEE_TOKEN",
+    "GITHUB_TOKEN",
+    "OPEN_ROUTER_KEY",
+    "OSCANNER_LLM_API_KEY",
+    "OSCANNER_LLM_BASE_URL",
+    "OSCANNER_LLM_CHAT_COMPLETIONS_URL",
+    "OSCANNER_LLM_MODEL",
+    "OSCANNER_LLM_FALLBACK_MODELS",
+    "OSCANNER_LLM_LIGHT_MODEL",
+    "OSCANNER_LLM_BUDGET_USD",
+    "OSCANNER_LLM_PRICE_PER_MTOK",
+    "OSCANNER_LLM_EVALS_PER_MIN",
+    "OSCANNER_LLM_TPM",
+    "OSCANNER_EVAL_CACHE_TTL_DAYS",
+    "OSCANNER_LLM_CACHE",
+    "OSCANNER_ALIAS_CONCURRENCY",
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+)
+_ENV_KEY_ORDER_SET = frozenset(_ENV_KEY_ORDER)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    # Temp file + fsync + os.replace: a crash mid-save never leaves a truncated token file.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def write_env_file(path: Path, env: Dict[str, str]) -> None:
@@ -37,32 +89,16 @@ def write_env_file(path: Path, env: Dict[str, str]) -> None:
         "# - Do NOT commit real keys to git.",
         "",
     ]
-    order = [
-        "GITEE_TOKEN",
-        "GITHUB_TOKEN",
-        "OPEN_ROUTER_KEY",
-        "OSCANNER_LLM_API_KEY",
-        "OSCANNER_LLM_BASE_URL",
-        "OSCANNER_LLM_CHAT_COMPLETIONS_URL",
-        "OSCANNER_LLM_MODEL",
-        "OSCANNER_LLM_FALLBACK_MODELS",
-        "OPENAI_API_KEY",
-        "OPENAI_BASE_URL",
-    ]
     lines: List[str] = []
     lines.extend(header)
-    for k in order:
+    for k in _ENV_KEY_ORDER:
         if k in env and env[k] != "":
             lines.append(f"{k}={env[k]}")
     # keep any other keys stable (avoid losing tokens like GITHUB_TOKEN if user adds here)
-    for k in sorted(env.keys()):
-        if k in order:
-            continue
-        if env[k] == "":
-            continue
+    for k in sorted(k for k in env if k not in _ENV_KEY_ORDER_SET and env[k] != ""):
         lines.append(f"{k}={env[k]}")
     lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+    _write_text_atomic(path, "\n".join(lines))
 
 
 def apply_env_to_process(env: Dict[str, str]) -> None:
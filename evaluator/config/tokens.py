@@ -1,7 +1,7 @@
 """Token management and secret masking utilities."""
 
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
 # Default model for evaluation (can be overridden per-request by query param `model=...`)
 DEFAULT_LLM_MODEL = os.getenv("OSCANNER_LLM_MODEL", "qwen/qwen3-coder-flash")
@@ -33,6 +33,106 @@ def get_llm_api_key() -> Optional[str]:
     )
 
 
+def get_llm_budget_usd() -> Optional[float]:
+    """Spend ceiling in USD from OSCANNER_LLM_BUDGET_USD (None = unlimited), read at call time."""
+    raw = (os.getenv("OSCANNER_LLM_BUDGET_USD") or "").strip()
+    if not raw:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        print(f"[Config] ⚠ Ignoring invalid OSCANNER_LLM_BUDGET_USD={raw!r}")
+        return None
+
+
+def get_eval_cache_ttl_seconds() -> Optional[float]:
+    """
+    Max age of a cached evaluation before it is recomputed, from OSCANNER_EVAL_CACHE_TTL_DAYS.
+
+    Defaults to 30 days; 0 (or a negative value) disables expiry.
+    """
+    raw = (os.getenv("OSCANNER_EVAL_CACHE_TTL_DAYS") or "").strip()
+    days = 30.0
+    if raw:
+        try:
+            days = float(raw)
+        except ValueError:
+            print(f"[Config] ⚠ Ignoring invalid OSCANNER_EVAL_CACHE_TTL_DAYS={raw!r}")
+    if days <= 0:
+        return None
+    return days * 86400
+
+
+def _positive_float_env(name: str) -> Optional[float]:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        print(f"[Config] ⚠ Ignoring invalid {name}={raw!r}")
+        return None
+    return value if value > 0 else None
+
+
+def get_llm_rate_limits() -> Tuple[Optional[float], Optional[float]]:
+    """
+    Client-side LLM limits (evaluations/min, tokens/min) from OSCANNER_LLM_EVALS_PER_MIN and
+    OSCANNER_LLM_TPM.
+
+    An evaluation is one evaluate_engineer run, which may send several requests (chunks,
+    retries). Unset, zero or invalid means unlimited. Limits apply per server process.
+    """
+    return _positive_float_env("OSCANNER_LLM_EVALS_PER_MIN"), _positive_float_env("OSCANNER_LLM_TPM")
+
+
+def get_llm_price_per_mtok() -> Optional[float]:
+    """
+    Fallback LLM price in USD per million tokens (prompt + completion), from
+    OSCANNER_LLM_PRICE_PER_MTOK.
+
+    Used for budgeting when the endpoint reports no cost (most OpenAI-compatible APIs).
+    """
+    return _positive_float_env("OSCANNER_LLM_PRICE_PER_MTOK")
+
+
+def get_alias_concurrency(default: int = 4) -> int:
+    """
+    Max alias identities evaluated at once, from OSCANNER_ALIAS_CONCURRENCY (at least 1).
+
+    Each identity is one long-running LLM evaluation; lower this for tight provider rate limits.
+    """
+    raw = (os.getenv("OSCANNER_ALIAS_CONCURRENCY") or "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        print(f"[Config] ⚠ Ignoring invalid OSCANNER_ALIAS_CONCURRENCY={raw!r}")
+        return default
+
+
+LLM_CACHE_POLICIES = ("enabled", "read_only", "replay", "disabled")
+
+
+def get_llm_cache_policy() -> str:
+    """
+    LLM result cache policy from OSCANNER_LLM_CACHE (default "enabled").
+
+    - enabled: reuse stored results and store new ones
+    - read_only: reuse stored results, store nothing
+    - replay: only serve stored results; a miss is an error instead of an LLM call
+    - disabled: always call the LLM
+    """
+    raw = (os.getenv("OSCANNER_LLM_CACHE") or "").strip().lower()
+    if not raw:
+        return "enabled"
+    if raw not in LLM_CACHE_POLICIES:
+        print(f"[Config] ⚠ Ignoring invalid OSCANNER_LLM_CACHE={raw!r}")
+        return "enabled"
+    return raw
+
+
 def mask_secret(value: Optional[str]) -> str:
     """Mask secrets in logs (show first 4 + last 4 chars)."""
     s = (value or "").strip()
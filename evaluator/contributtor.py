@@ -3,11 +3,13 @@ Contributor clustering module for analyzing GitHub repository contributors.
 Clusters contributors based on their names and emails from commits_list.json files.
 """
 
+import heapq
 import json
 import os
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
+from operator import itemgetter
 from difflib import SequenceMatcher
 
 from evaluator.paths import get_data_dir
@@ -53,8 +55,8 @@ class ContributorCluster:
         return {
             "primary_name": self.get_primary_name(),
             "primary_email": self.get_primary_email(),
-            "all_names": sorted(list(self.names)),
-            "all_emails": sorted(list(self.emails)),
+            "all_names": sorted(self.names),
+            "all_emails": sorted(self.emails),
             "commit_count": self.commit_count,
             "commits": self.commits
         }
@@ -175,7 +177,8 @@ class ContributorClusterer:
     def get_clusters(self) -> List[Dict]:
         """Get all clusters as dictionaries, sorted by commit count."""
         clusters_data = [cluster.to_dict() for cluster in self.clusters]
-        return sorted(clusters_data, key=lambda x: x['commit_count'], reverse=True)
+        clusters_data.sort(key=itemgetter('commit_count'), reverse=True)
+        return clusters_data
 
 
 def load_commits_list(repo_path: Path) -> List[Dict]:
@@ -335,8 +338,8 @@ def main():
         print("TOP REPOSITORIES BY CONTRIBUTOR COUNT")
         print("=" * 60)
 
-        sorted_results = sorted(results, key=lambda x: x['total_contributors'], reverse=True)
-        for result in sorted_results[:10]:
+        # Only the top 10 are printed; a bounded heap avoids sorting every repo
+        for result in heapq.nlargest(10, results, key=itemgetter('total_contributors')):
             print(f"{result['repo']}: {result['total_contributors']} contributors, {result['total_commits']} commits")
 
     # Save detailed results
@@ -4,6 +4,8 @@ Core evaluation engine for the Engineer Capability Assessment System
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
+from operator import attrgetter
+import heapq
 import json
 
 from .dimensions import get_all_evaluators, DimensionScore
@@ -40,11 +42,11 @@ class EvaluationResult:
 
     def get_top_dimensions(self, n: int = 3) -> List[DimensionScore]:
         """Get top N performing dimensions"""
-        return sorted(self.dimension_scores, key=lambda x: x.score, reverse=True)[:n]
+        return heapq.nlargest(n, self.dimension_scores, key=attrgetter("score"))
 
     def get_bottom_dimensions(self, n: int = 3) -> List[DimensionScore]:
         """Get bottom N performing dimensions"""
-        return sorted(self.dimension_scores, key=lambda x: x.score)[:n]
+        return heapq.nsmallest(n, self.dimension_scores, key=attrgetter("score"))
 
     def get_report(self, format: str = "text") -> str:
         """
@@ -13,6 +13,7 @@ from dotenv import load_dotenv
 
 from evaluator.paths import get_home_dir
 from evaluator.plugin_registry import load_scan_module
+from evaluator.utils import iter_json_files, iter_json_paths
 
 # Load environment variables
 load_dotenv('.env.local')
@@ -39,9 +40,10 @@ def load_commits_from_local(data_dir: Path, limit: int = 30) -> list:
     with open(commits_index_path, 'r', encoding='utf-8') as f:
         commits_index = json.load(f)
 
-    # Load detailed commit data
-    commits = []
+    # Collect the commit JSON files to load (one directory listing instead of a stat per commit)
     commits_dir = data_dir / "commits"
+    available = {os.path.basename(path) for path in iter_json_paths(commits_dir)}
+    commit_json_paths = []
 
     for commit_info in commits_index[:limit]:
         commit_sha = commit_info.get("hash") or commit_info.get("sha")
@@ -49,16 +51,13 @@ def load_commits_from_local(data_dir: Path, limit: int = 30) -> list:
         if not commit_sha:
             continue
 
-        # Try to load commit JSON
-        commit_json_path = commits_dir / f"{commit_sha}.json"
+        commit_file_name = f"{commit_sha}.json"
 
-        if commit_json_path.exists():
-            try:
-                with open(commit_json_path, 'r', encoding='utf-8') as f:
-                    commit_data = json.load(f)
-                    commits.append(commit_data)
-            except Exception as e:
-                print(f"[Warning] Failed to load {commit_sha}: {e}")
+        if commit_file_name in available:
+            commit_json_paths.append(commits_dir / commit_file_name)
+
+    # Load detailed commit data (read on a thread pool, index order kept)
+    commits = [commit_data for _, commit_data in iter_json_files(commit_json_paths)]
 
     print(f"[Info] Loaded {len(commits)} detailed commits")
     return commits
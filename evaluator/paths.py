@@ -83,6 +83,16 @@ def ensure_platform_dirs(platform: str, owner: str, repo: str) -> None:
     get_platform_eval_dir(platform, owner, repo).mkdir(parents=True, exist_ok=True)
 
 
+def get_budget_log_path() -> Path:
+    """
+    Get the append-only LLM spend log.
+
+    Returns:
+        Path: home/evaluations/budget.log
+    """
+    return get_home_dir() / "evaluations" / "budget.log"
+
+
 def get_trajectory_cache_dir() -> Path:
     """
     Get trajectory cache directory for growth tracking.
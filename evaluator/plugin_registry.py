@@ -10,8 +10,10 @@ Design goals:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import importlib.util
 import os
+import re
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Dict, List, Optional, Tuple
@@ -38,29 +40,35 @@ class PluginMeta:
     view_single_entry: str
     view_compare_entry: str
     view_entry: str
+    # Whether each view entry exists in the plugin dir, checked once at discovery
+    has_view_single: bool = False
+    has_view_compare: bool = False
+    has_view: bool = False
+
+    # (field, index.yaml key, default) for the plain string fields; plugin_id, name and
+    # default need their own fallbacks.
+    _STR_FIELDS = (
+        ("version", "version", "0.0.0"),
+        ("description", "description", ""),
+        ("scan_entry", "scan_entry", "scan/__init__.py"),
+        ("view_single_entry", "view_single_entry", "view/single_repo.tsx"),
+        ("view_compare_entry", "view_compare_entry", "view/multi_repo_compare.tsx"),
+        ("view_entry", "view_entry", "view/index.tsx"),
+    )
 
     @classmethod
     def from_dict(cls, d: Dict[str, str], plugin_dir: Path) -> "PluginMeta":
+        # Values from _parse_simple_yaml are already stripped, except inside quotes.
         plugin_id = (d.get("id") or d.get("plugin_id") or plugin_dir.name).strip()
-        name = (d.get("name") or plugin_id).strip()
-        version = (d.get("version") or "0.0.0").strip()
-        description = (d.get("description") or "").strip()
-        default_raw = (d.get("default") or "").strip().lower()
-        default = default_raw in ("1", "true", "yes", "y", "on")
-        scan_entry = (d.get("scan_entry") or "scan/__init__.py").strip()
-        view_single_entry = (d.get("view_single_entry") or "view/single_repo.tsx").strip()
-        view_compare_entry = (d.get("view_compare_entry") or "view/multi_repo_compare.tsx").strip()
-        view_entry = (d.get("view_entry") or "view/index.tsx").strip()
+        kwargs: Dict[str, Any] = {field: (d.get(key) or dflt).strip() for field, key, dflt in cls._STR_FIELDS}
         return cls(
             plugin_id=plugin_id,
-            name=name,
-            version=version,
-            description=description,
-            default=default,
-            scan_entry=scan_entry,
-            view_single_entry=view_single_entry,
-            view_compare_entry=view_compare_entry,
-            view_entry=view_entry,
+            name=(d.get("name") or plugin_id).strip(),
+            default=(d.get("default") or "").strip().lower() in ("1", "true", "yes", "y", "on"),
+            has_view_single=os.path.exists(plugin_dir / kwargs["view_single_entry"]),
+            has_view_compare=os.path.exists(plugin_dir / kwargs["view_compare_entry"]),
+            has_view=os.path.exists(plugin_dir / kwargs["view_entry"]),
+            **kwargs,
         )
 
 
@@ -68,6 +76,7 @@ class PluginLoadError(RuntimeError):
     pass
 
 
+@lru_cache(maxsize=None)
 def _find_repo_root() -> Path:
     """
     Best-effort locate repository root (directory containing pyproject.toml).
@@ -111,6 +120,24 @@ def get_plugins_dir() -> Optional[Path]:
     return None
 
 
+# One flat `key: value` pair per line; comment and blank lines never match.
+_YAML_PAIR_RE = re.compile(r"^[ \t]*([^#\s:][^:\r\n]*?)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+@lru_cache(maxsize=64)
+def _parse_simple_yaml_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    # mtime/size are part of the cache key so an edited index.yaml is re-parsed.
+    with open(path, "r", encoding="utf-8") as f:
+        raw = f.read()
+    pairs = []
+    for key, val in _YAML_PAIR_RE.findall(raw):
+        # Strip simple quotes
+        if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
+            val = val[1:-1]
+        pairs.append((key, val))
+    return tuple(pairs)
+
+
 def _parse_simple_yaml(path: Path) -> Dict[str, str]:
     """
     Parse a very small subset of YAML:
@@ -118,40 +145,66 @@ def _parse_simple_yaml(path: Path) -> Dict[str, str]:
     - Ignores blank lines and comments (# ...)
     - Values may be quoted or unquoted
     """
-    data: Dict[str, str] = {}
-    raw = path.read_text(encoding="utf-8")
-    for line in raw.splitlines():
-        s = line.strip()
-        if not s or s.startswith("#"):
-            continue
-        if ":" not in s:
-            continue
-        k, v = s.split(":", 1)
-        key = k.strip()
-        val = v.strip()
-        if not key:
-            continue
-        # Strip simple quotes
-        if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-            val = val[1:-1]
-        data[key] = val
-    return data
+    st = path.stat()
+    return dict(_parse_simple_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+# plugins_dir -> (dir mtime, sorted plugin subdirs); re-listed only when entries change.
+_plugin_dirs_cache: Dict[Path, Tuple[int, List[Path]]] = {}
+# plugins_dir -> (index.yaml stats, discovered plugins)
+_discovery_cache: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], List[Tuple[PluginMeta, Path]]]] = {}
+
+
+def _list_plugin_dirs(plugins_dir: Path) -> List[Path]:
+    mtime_ns = plugins_dir.stat().st_mtime_ns
+    cached = _plugin_dirs_cache.get(plugins_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with os.scandir(plugins_dir) as it:
+        dirs = sorted(Path(e.path) for e in it if e.is_dir())
+    _plugin_dirs_cache[plugins_dir] = (mtime_ns, dirs)
+    return dirs
 
 
 def discover_plugins() -> List[Tuple[PluginMeta, Path]]:
     """
     Discover plugins under plugins_dir.
     Returns: list of (meta, plugin_dir)
+
+    The result is cached until a plugin dir is added/removed or an index.yaml changes, so
+    per-request callers (load_scan_module) only pay one stat per plugin.
+    """
+    return list(discover_plugins_shared())
+
+
+_NO_PLUGINS: List[Tuple[PluginMeta, Path]] = []
+
+
+def discover_plugins_shared() -> List[Tuple[PluginMeta, Path]]:
+    """
+    Like discover_plugins(), but return the cached list itself (callers must not mutate it).
+
+    The same list object is returned for as long as discovery is unchanged, so callers can
+    key their own derived caches on its identity.
     """
     plugins_dir = get_plugins_dir()
     if not plugins_dir:
-        return []
+        return _NO_PLUGINS
+
+    indexes: List[Tuple[Path, os.stat_result]] = []
+    for plugin_dir in _list_plugin_dirs(plugins_dir):
+        try:
+            indexes.append((plugin_dir, (plugin_dir / "index.yaml").stat()))
+        except OSError:
+            continue
+    key = tuple((str(d), st.st_mtime_ns, st.st_size) for d, st in indexes)
+    cached = _discovery_cache.get(plugins_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
     found: List[Tuple[PluginMeta, Path]] = []
-    for plugin_dir in sorted([p for p in plugins_dir.iterdir() if p.is_dir()]):
+    for plugin_dir, _ in indexes:
         idx = plugin_dir / "index.yaml"
-        if not idx.exists():
-            continue
         try:
             d = _parse_simple_yaml(idx)
             meta = PluginMeta.from_dict(d, plugin_dir)
@@ -161,6 +214,7 @@ def discover_plugins() -> List[Tuple[PluginMeta, Path]]:
             # The API layer can optionally surface warnings.
             _ = e
             continue
+    _discovery_cache[plugins_dir] = (key, found)
     return found
 
 
@@ -177,6 +231,16 @@ def get_default_plugin_id(plugins: List[Tuple[PluginMeta, Path]]) -> Optional[st
     return plugins[0][0].plugin_id
 
 
+@lru_cache(maxsize=64)
+def _resolve_entry(plugin_dir: Path, entry: str) -> Path:
+    # Plugin dirs and their entry names are fixed for the life of a discovery result
+    return (plugin_dir / entry).resolve()
+
+
+# plugin_id -> ((scan path, mtime_ns, size), imported scan module); re-imported when the file changes
+_scan_module_cache: Dict[str, Tuple[Tuple[str, int, int], ModuleType]] = {}
+
+
 def load_scan_module(plugin_id: str) -> Tuple[PluginMeta, ModuleType, Path]:
     """
     Load a plugin's scan module from file path.
@@ -184,15 +248,23 @@ def load_scan_module(plugin_id: str) -> Tuple[PluginMeta, ModuleType, Path]:
     Contract:
     - scan_entry points to a python file relative to the plugin dir (default: scan/__init__.py)
     - the module must export `create_commit_evaluator(...)` callable
+
+    The imported module is reused until its file changes, so an evaluation only pays a stat.
     """
-    plugins = discover_plugins()
+    plugins = discover_plugins_shared()
     for meta, plugin_dir in plugins:
         if meta.plugin_id != plugin_id:
             continue
 
-        scan_path = (plugin_dir / meta.scan_entry).resolve()
-        if not scan_path.exists():
+        scan_path = _resolve_entry(plugin_dir, meta.scan_entry)
+        try:
+            st = scan_path.stat()
+        except OSError:
             raise PluginLoadError(f"Plugin '{plugin_id}' scan_entry not found: {scan_path}")
+        key = (str(scan_path), st.st_mtime_ns, st.st_size)
+        cached = _scan_module_cache.get(plugin_id)
+        if cached is not None and cached[0] == key:
+            return meta, cached[1], scan_path
 
         module_name = f"oscanner_plugin_{plugin_id}_scan"
         spec = importlib.util.spec_from_file_location(module_name, str(scan_path))
@@ -210,6 +282,7 @@ def load_scan_module(plugin_id: str) -> Tuple[PluginMeta, ModuleType, Path]:
                 f"Plugin '{plugin_id}' scan module must define create_commit_evaluator(...): {scan_path}"
             )
 
+        _scan_module_cache[plugin_id] = (key, mod)
         return meta, mod, scan_path
 
     available = [m.plugin_id for m, _ in plugins]
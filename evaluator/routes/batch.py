@@ -1,12 +1,12 @@
 """Batch operation routes - multi-repo processing."""
 
-import json
+import asyncio
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 
 from evaluator.services import extract_github_data, extract_gitee_data, resolve_plugin_id
 from evaluator.paths import get_platform_data_dir
-from evaluator.utils import parse_repo_url, get_author_from_commit
+from evaluator.utils import parse_repo_url, get_author_from_commit, iter_json_files, iter_json_paths
 from evaluator.config import DEFAULT_LLM_MODEL
 from evaluator.routes.evaluation import evaluate_author
 
@@ -50,7 +50,7 @@ async def batch_extract_repos(request: dict):
         data_dir = get_platform_data_dir(platform, owner, repo)
         commits_dir = data_dir / "commits"
 
-        if data_dir.exists() and commits_dir.exists() and list(commits_dir.glob("*.json")):
+        if data_dir.exists() and commits_dir.exists() and next(iter_json_paths(commits_dir), None) is not None:
             result["status"] = "skipped"
             result["message"] = "Repository data already exists"
             result["data_exists"] = True
@@ -60,9 +60,9 @@ async def batch_extract_repos(request: dict):
         # Extract
         try:
             if platform == "github":
-                success = extract_github_data(owner, repo)
+                success = await asyncio.to_thread(extract_github_data, owner, repo)
             else:
-                success = extract_gitee_data(owner, repo)
+                success = await asyncio.to_thread(extract_gitee_data, owner, repo)
 
             if success:
                 result["status"] = "extracted"
@@ -176,14 +176,15 @@ async def find_common_contributors(request: dict):
 
         authors_map = {}
 
-        # Load all commit files
-        for commit_file in commits_dir.glob("*.json"):
+        # Load all commit files (read on a thread pool, aggregated here)
+        for commit_file, commit_data in iter_json_files(iter_json_paths(commits_dir)):
             try:
-                with open(commit_file, 'r', encoding='utf-8') as f:
-                    commit_data = json.load(f)
-                    author = get_author_from_commit(commit_data)
-
-                    # Get email and GitHub user ID
+                author = get_author_from_commit(commit_data)
+                if not author:
+                    continue
+                entry = authors_map.get(author)
+                if entry is None:
+                    # Identity fields are only taken from an author's first commit
                     email = ""
                     github_id = None
                     github_login = None
@@ -196,15 +197,13 @@ async def find_common_contributors(request: dict):
                         github_id = commit_data["author"].get("id")
                         github_login = commit_data["author"].get("login")
 
-                    if author:
-                        if author not in authors_map:
-                            authors_map[author] = {
-                                "commits": 0,
-                                "email": email,
-                                "github_id": github_id,
-                                "github_login": github_login
-                            }
-                        authors_map[author]["commits"] += 1
+                    entry = authors_map[author] = {
+                        "commits": 0,
+                        "email": email,
+                        "github_id": github_id,
+                        "github_login": github_login
+                    }
+                entry["commits"] += 1
             except Exception as e:
                 print(f"⚠ Error reading {commit_file}: {e}")
                 continue
@@ -416,7 +415,7 @@ async def find_common_contributors(request: dict):
                 "repos": repos_with_author,
                 "total_commits": total_commits,
                 "repo_count": len(repos_with_author),
-                "matched_by": canonical_key.split(":")[0]  # "github_id", "github_login", "aliases", or "name"
+                "matched_by": canonical_key.partition(":")[0]  # "github_id", "github_login", "aliases", or "name"
             })
 
     # Sort by repo_count (descending), then by total_commits (descending)
@@ -522,9 +521,9 @@ async def compare_contributor_across_repos(request: dict):
                 print(f"⚡ Data not found for {owner}/{repo}, triggering real-time extraction...")
                 try:
                     if repo_platform == "github":
-                        extraction_success = extract_github_data(owner, repo)
+                        extraction_success = await asyncio.to_thread(extract_github_data, owner, repo)
                     else:
-                        extraction_success = extract_gitee_data(owner, repo)
+                        extraction_success = await asyncio.to_thread(extract_gitee_data, owner, repo)
 
                     if not extraction_success:
                         failed_repos.append({
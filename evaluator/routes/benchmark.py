@@ -1,6 +1,6 @@
 """Benchmark and validation routes."""
 
-import json
+import asyncio
 from pathlib import Path
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Query
@@ -17,10 +17,13 @@ except ImportError:
 from evaluator.paths import get_platform_data_dir, get_platform_eval_dir
 from evaluator.plugin_registry import load_scan_module, PluginLoadError
 from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL
-from evaluator.utils import load_commits_from_local
+from evaluator.utils import load_commits_from_local, write_json_atomic
 from evaluator.services import (
     resolve_plugin_id,
     get_evaluation_cache_path,
+    get_scan_module_digest,
+    evaluation_cache_key,
+    load_cached_evaluation,
     get_plugins_snapshot,
     evaluate_author_incremental,
     extract_github_data,
@@ -40,9 +43,9 @@ async def extract_commits_from_platform(platform: str, owner: str, repo: str):
         repo: Repository name
     """
     if platform == "github":
-        return extract_github_data(owner, repo)
+        return await asyncio.to_thread(extract_github_data, owner, repo)
     elif platform == "gitee":
-        return extract_gitee_data(owner, repo)
+        return await asyncio.to_thread(extract_gitee_data, owner, repo)
     else:
         raise ValueError(f"Unsupported platform: {platform}")
 
@@ -105,13 +108,11 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
     default_plugin_id = get_plugins_snapshot()[1]
     eval_path = get_evaluation_cache_path(eval_dir, author, plugin_id, default_plugin_id)
 
-    previous_evaluation = None
-    if eval_path.exists():
-        try:
-            with open(eval_path, 'r', encoding='utf-8') as f:
-                previous_evaluation = json.load(f)
-        except Exception as e:
-            print(f"[Benchmark] Failed to load cached evaluation: {e}")
+    # Benchmark runs use the plugin's default language
+    cache_key = evaluation_cache_key(
+        plugin_id, meta.version if meta else "", model, "en-US", get_scan_module_digest(scan_path)
+    )
+    previous_evaluation = load_cached_evaluation(eval_path, cache_key)
 
     # Get API key
     api_key = get_llm_api_key()
@@ -141,9 +142,9 @@ async def evaluation_function_wrapper(repo_url: str, author: str, plugin_id: str
     )
 
     # Save evaluation
+    result["cache_key"] = cache_key
     eval_dir.mkdir(parents=True, exist_ok=True)
-    with open(eval_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    write_json_atomic(eval_path, result)
 
     return result
 
@@ -24,20 +24,27 @@ async def get_llm_config():
     Read current LLM config from user dotfile + process env (masked).
     """
     path = get_user_env_path()
-    file_env = parse_env_file(path) if path.exists() else {}
+    # parse_env_file returns {} for a missing file; no separate exists() check needed
+    file_env = parse_env_file(path)
+
+    def _setting(key: str) -> str:
+        # User dotfile wins over the process environment
+        return file_env.get(key) or os.getenv(key) or ""
+
     api_key = get_llm_api_key()
+    openrouter_key = _setting("OPEN_ROUTER_KEY")
     cfg = {
         "configured": bool(api_key),
         "path": str(path),
-        "mode": "openrouter" if (file_env.get("OPEN_ROUTER_KEY") or os.getenv("OPEN_ROUTER_KEY")) else "openai",
-        "openrouter_key_masked": mask_secret(file_env.get("OPEN_ROUTER_KEY") or os.getenv("OPEN_ROUTER_KEY")),
-        "oscanner_llm_api_key_masked": mask_secret(file_env.get("OSCANNER_LLM_API_KEY") or os.getenv("OSCANNER_LLM_API_KEY")),
-        "gitee_token_masked": mask_secret(file_env.get("GITEE_TOKEN") or os.getenv("GITEE_TOKEN")),
-        "github_token_masked": mask_secret(file_env.get("GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN")),
-        "oscanner_llm_base_url": file_env.get("OSCANNER_LLM_BASE_URL") or os.getenv("OSCANNER_LLM_BASE_URL") or os.getenv("OPENAI_BASE_URL") or "",
-        "oscanner_llm_chat_completions_url": file_env.get("OSCANNER_LLM_CHAT_COMPLETIONS_URL") or os.getenv("OSCANNER_LLM_CHAT_COMPLETIONS_URL") or "",
-        "oscanner_llm_model": file_env.get("OSCANNER_LLM_MODEL") or os.getenv("OSCANNER_LLM_MODEL") or DEFAULT_LLM_MODEL,
-        "oscanner_llm_fallback_models": file_env.get("OSCANNER_LLM_FALLBACK_MODELS") or os.getenv("OSCANNER_LLM_FALLBACK_MODELS") or "",
+        "mode": "openrouter" if openrouter_key else "openai",
+        "openrouter_key_masked": mask_secret(openrouter_key),
+        "oscanner_llm_api_key_masked": mask_secret(_setting("OSCANNER_LLM_API_KEY")),
+        "gitee_token_masked": mask_secret(_setting("GITEE_TOKEN")),
+        "github_token_masked": mask_secret(_setting("GITHUB_TOKEN")),
+        "oscanner_llm_base_url": _setting("OSCANNER_LLM_BASE_URL") or os.getenv("OPENAI_BASE_URL") or "",
+        "oscanner_llm_chat_completions_url": _setting("OSCANNER_LLM_CHAT_COMPLETIONS_URL"),
+        "oscanner_llm_model": _setting("OSCANNER_LLM_MODEL") or DEFAULT_LLM_MODEL,
+        "oscanner_llm_fallback_models": _setting("OSCANNER_LLM_FALLBACK_MODELS"),
     }
     return cfg
 
@@ -1,15 +1,23 @@
 """Data extraction and author discovery routes."""
 
-import json
+import asyncio
+import os
+from collections import Counter
 from fastapi import APIRouter, HTTPException, Query
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from evaluator.paths import get_platform_data_dir
 from evaluator.services import extract_github_data, extract_gitee_data, fetch_gitee_commits
-from evaluator.utils import get_author_from_commit
+from evaluator.utils import (
+    get_author_from_commit, iter_json_files, iter_json_paths, loads_json, write_json_atomic
+)
 
 router = APIRouter()
 
+# Authors listing (plus per-commit author/email summaries) persisted next to the commit data
+_AUTHORS_INDEX_NAME = "authors_index.json"
+
 
 @router.get("/api/gitee/commits/{owner}/{repo}")
 async def get_gitee_commits(
@@ -30,6 +38,107 @@ async def get_gitee_commits(
     }
 
 
+def _commit_email(commit_data: Dict[str, Any]) -> str:
+    """Author email of a commit (GitHub/Gitee shapes differ)."""
+    email = ""
+    if "commit" in commit_data:
+        email = commit_data.get("commit", {}).get("author", {}).get("email", "") or ""
+    if not email and isinstance(commit_data.get("author"), dict):
+        email = commit_data.get("author", {}).get("email", "") or ""
+    if not email and isinstance(commit_data.get("committer"), dict):
+        email = commit_data.get("committer", {}).get("email", "") or ""
+    return email
+
+
+def _collect_authors(
+    commits_dir: Path, known: Dict[str, List[str]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+    """
+    Authors in commits_dir with their commit counts, most active first.
+
+    Returns (authors, summaries), where summaries maps each commit file name to its
+    [author, email]. Files already summarized in `known` are not read again; the rest are
+    read and parsed on a thread pool. Counting happens on the calling thread, so no locking is
+    needed. Email comes from each author's first commit seen.
+    """
+    paths = list(iter_json_paths(commits_dir))
+    summaries: Dict[str, List[str]] = {}
+    unread = []
+    for path in paths:
+        summary = known.get(os.path.basename(path))
+        if summary is not None:
+            summaries[os.path.basename(path)] = summary
+        else:
+            unread.append(path)
+
+    for commit_file, commit_data in iter_json_files(unread):
+        try:
+            author = get_author_from_commit(commit_data) or ""
+            summaries[os.path.basename(commit_file)] = [author, _commit_email(commit_data) if author else ""]
+        except Exception as e:
+            print(f"⚠ Error reading {commit_file}: {e}")
+            continue
+
+    commit_counts: Counter = Counter()
+    emails: Dict[str, str] = {}
+    for path in paths:
+        summary = summaries.get(os.path.basename(path))
+        if not summary or not summary[0]:
+            continue
+        author, email = summary
+        commit_counts[author] += 1
+        if author not in emails:
+            emails[author] = email
+
+    # Sort by commit count (most_common is a stable sort, ties keep first-seen order)
+    authors = [
+        {"author": author, "email": emails[author], "commits": count}
+        for author, count in commit_counts.most_common()
+    ]
+    return authors, summaries
+
+
+def _read_authors_index(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'rb') as f:
+            index = loads_json(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠ Ignoring unreadable authors index {path}: {e}")
+        return None
+    return index if isinstance(index, dict) else None
+
+
+def _get_authors(data_dir: Path, use_cache: bool = True) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Authors listing for data_dir as (authors, cached).
+
+    The stored index holds the listing plus a per-file [author, email] summary. While no
+    commit file is added or removed (the commits directory's mtime is unchanged) the listing
+    is served as is; otherwise only new files are parsed. use_cache=False rescans everything.
+    """
+    commits_dir = data_dir / "commits"
+    index_path = data_dir / _AUTHORS_INDEX_NAME
+    key = {"commits_mtime_ns": commits_dir.stat().st_mtime_ns}
+    known: Dict[str, List[str]] = {}
+    if use_cache:
+        index = _read_authors_index(index_path)
+        if index is not None:
+            if index.get("key") == key and isinstance(index.get("authors"), list):
+                return index["authors"], True
+            if isinstance(index.get("commits"), dict):
+                known = index["commits"]
+
+    authors, summaries = _collect_authors(commits_dir, known)
+    if authors:
+        try:
+            write_json_atomic(index_path, {"key": key, "authors": authors, "commits": summaries}, indent=False)
+        except Exception as e:
+            print(f"⚠ Failed to write authors index {index_path}: {e}")
+    return authors, False
+
+
 @router.get("/api/authors/{owner}/{repo}")
 async def get_authors(owner: str, repo: str, platform: str = Query("github"), use_cache: bool = Query(True)):
     """
@@ -38,7 +147,8 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
     Flow:
     1. Check if local data exists in platform-specific directory
     2. If no local data, extract it from GitHub/Gitee
-    3. Load ALL authors from commits (always scans all commits)
+    3. Load ALL authors from commits (reusing the stored listing while no commit file was
+       added or removed; use_cache=false forces a full scan)
     4. Return complete authors list
     """
     try:
@@ -49,12 +159,12 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
             plat = (platform or "github").strip().lower()
             if plat == "gitee":
                 print(f"No local data found for {owner}/{repo}, extracting from Gitee...")
-                success = extract_gitee_data(owner, repo)
+                success = await asyncio.to_thread(extract_gitee_data, owner, repo)
                 if not success:
                     raise HTTPException(status_code=500, detail=f"Failed to extract Gitee data for {owner}/{repo}")
             else:
                 print(f"No local data found for {owner}/{repo}, extracting from GitHub...")
-                success = extract_github_data(owner, repo)
+                success = await asyncio.to_thread(extract_github_data, owner, repo)
                 if not success:
                     raise HTTPException(status_code=500, detail=f"Failed to extract GitHub data for {owner}/{repo}")
 
@@ -66,49 +176,14 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
                 detail=f"No commit data found for {owner}/{repo}"
             )
 
-        authors_map = {}
-
-        # Check for direct .json files in commits directory
-        for commit_file in commits_dir.glob("*.json"):
-            try:
-                with open(commit_file, 'r', encoding='utf-8') as f:
-                    commit_data = json.load(f)
-                    author = get_author_from_commit(commit_data)
-
-                    # Get email from commit data (GitHub/Gitee shapes differ)
-                    email = ""
-                    if "commit" in commit_data:
-                        email = commit_data.get("commit", {}).get("author", {}).get("email", "") or ""
-                    if not email and isinstance(commit_data.get("author"), dict):
-                        email = commit_data.get("author", {}).get("email", "") or ""
-                    if not email and isinstance(commit_data.get("committer"), dict):
-                        email = commit_data.get("committer", {}).get("email", "") or ""
-
-                    if author:
-                        if author not in authors_map:
-                            authors_map[author] = {
-                                "author": author,
-                                "email": email,
-                                "commits": 0
-                            }
-                        authors_map[author]["commits"] += 1
-            except Exception as e:
-                print(f"⚠ Error reading {commit_file}: {e}")
-                continue
-
-        if not authors_map:
+        # Reading thousands of commit files must not stall the event loop
+        authors_list, cached = await asyncio.to_thread(_get_authors, data_dir, use_cache)
+        if not authors_list:
             raise HTTPException(
                 status_code=404,
                 detail=f"No commit authors found in {commits_dir}"
             )
 
-        # Sort by commit count
-        authors_list = sorted(
-            authors_map.values(),
-            key=lambda x: x["commits"],
-            reverse=True
-        )
-
         return {
             "success": True,
             "data": {
@@ -116,7 +191,7 @@ async def get_authors(owner: str, repo: str, platform: str = Query("github"), us
                 "repo": repo,
                 "authors": authors_list,
                 "total_authors": len(authors_list),
-                "cached": False
+                "cached": cached
             }
         }
 
@@ -1,27 +1,137 @@
 """Evaluation routes - author evaluation endpoints."""
 
-import json
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
 
 from evaluator.paths import get_platform_data_dir, get_platform_eval_dir
 from evaluator.plugin_registry import load_scan_module, PluginLoadError
-from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL, get_gitee_token
-from evaluator.utils import load_commits_from_local
+from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL, get_gitee_token, get_alias_concurrency
+from evaluator.utils import (
+    load_commits_from_local, filter_commits_by_authors, build_author_index, select_commits_by_authors,
+    write_json_atomic, FastJSONResponse,
+)
 from evaluator.schemas import EvaluationResponseSchema
 from evaluator.services import (
     resolve_plugin_id,
     get_evaluation_cache_path,
     get_plugins_snapshot,
+    get_scan_module_digest,
     evaluate_author_incremental,
+    find_evaluation_by_fingerprint,
+    evaluation_cache_key,
+    load_cached_evaluation,
+    evaluation_age_if_expired,
     get_repo_data_dir,
     fetch_gitee_commits,
     merge_evaluations_logic,
+    check_llm_budget,
+    record_llm_usage,
+    acquire_llm_capacity,
 )
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Evaluation payloads are large nested dicts; serialize them with orjson when available.
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# Upper bound on identities evaluated concurrently (keeps OpenRouter rate limits in check);
+# OSCANNER_ALIAS_CONCURRENCY overrides it.
+_MAX_ALIAS_WORKERS = 4
+
+
+def _load_local_commits(data_dir: Path, platform: str, owner: str, repo: str, empty_detail: str) -> list:
+    """
+    Load all extracted commits, raising 404 if there are none.
+
+    Whether the data directory exists at all is only checked once the load came back empty.
+    """
+    commits = load_commits_from_local(data_dir, None)
+    if commits:
+        return commits
+    if not data_dir.is_dir():
+        raise HTTPException(status_code=404, detail=f"No local data found for {platform}/{owner}/{repo}. Please extract data first.")
+    raise HTTPException(status_code=404, detail=empty_detail)
+
+
+def _evaluation_response(
+    evaluation: Dict[str, Any], cached: bool = False, source: Optional[str] = None
+) -> Dict[str, Any]:
+    """Wrap an evaluation in the EvaluationResponseSchema envelope, stamped once."""
+    metadata: Dict[str, Any] = {"cached": cached, "timestamp": datetime.now().isoformat()}
+    if source:
+        metadata["source"] = source
+    return {"success": True, "evaluation": evaluation, "metadata": metadata}
+
+
+def _save_evaluation(eval_path: Path, evaluation: Dict[str, Any]) -> None:
+    eval_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(eval_path, evaluation)
+
+
+def _make_evaluator_factory(scan_mod: Any, **evaluator_kwargs: Any) -> Callable[[], Any]:
+    """
+    Bind a plugin's create_commit_evaluator to this request's settings.
+
+    Each call still builds a fresh evaluator: an evaluator resets and reports its LLM usage
+    per run, so concurrently evaluated aliases must not share one.
+    """
+    def _factory():
+        return scan_mod.create_commit_evaluator(**evaluator_kwargs)
+    return _factory
+
+
+# Recent single-author results. While neither the saved evaluation nor the extracted commit
+# data has changed, a repeat request would only re-read both and get the same answer back.
+_RESULT_MEMO_SIZE = 512
+_result_memo: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_result_memo_lock = threading.Lock()
+
+
+def _result_memo_key(
+    eval_path: Path, data_dir: Path, cache_key: str, aliases: Optional[Sequence[str]]
+) -> Optional[Tuple]:
+    """Key covering every input of a cached result; None if the files cannot be stat-ed."""
+    try:
+        eval_stat = eval_path.stat()
+        index_stat = (data_dir / "commits_index.json").stat()
+        commits_dir_stat = (data_dir / "commits").stat()
+    except OSError:
+        return None
+    return (
+        str(eval_path), eval_stat.st_mtime_ns, eval_stat.st_size,
+        index_stat.st_mtime_ns, index_stat.st_size, commits_dir_stat.st_mtime_ns,
+        cache_key, tuple(aliases or ()),
+    )
+
+
+def _get_memoized_result(key: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+    if key is None:
+        return None
+    with _result_memo_lock:
+        evaluation = _result_memo.get(key)
+        if evaluation is None:
+            return None
+        if evaluation_age_if_expired(evaluation) is not None:
+            del _result_memo[key]
+            return None
+        _result_memo.move_to_end(key)
+        return evaluation
+
+
+def _memoize_result(key: Optional[Tuple], evaluation: Dict[str, Any]) -> None:
+    if key is None:
+        return
+    with _result_memo_lock:
+        _result_memo[key] = evaluation
+        _result_memo.move_to_end(key)
+        while len(_result_memo) > _RESULT_MEMO_SIZE:
+            _result_memo.popitem(last=False)
 
 
 @router.post("/api/evaluate/{owner}/{repo}/{author}", response_model=EvaluationResponseSchema)
@@ -31,7 +141,7 @@ async def evaluate_author(
     author: str,
     use_chunking: bool = Query(True),
     use_cache: bool = Query(True),
-    model: str = Query(DEFAULT_LLM_MODEL),
+    model: str = Query(DEFAULT_LLM_MODEL, min_length=1, max_length=128),
     platform: str = Query("github"),
     plugin: str = Query(""),
     language: str = Query("en-US"),
@@ -54,14 +164,17 @@ async def evaluate_author(
         if request_body and isinstance(request_body, dict):
             aliases_list = request_body.get("aliases")
             if aliases_list and isinstance(aliases_list, list):
-                aliases = [str(a).lower().strip() for a in aliases_list if a]
+                # Normalized and de-duplicated (first occurrence wins) so no identity is evaluated twice
+                aliases = list(dict.fromkeys(str(a).lower().strip() for a in aliases_list if a))
 
         # Normalize parameters (handle Query objects and type conversion)
         # When this function is called programmatically, Query objects aren't resolved by FastAPI
         from fastapi.params import Query as QueryType
 
-        if not isinstance(model, str):
-            model = DEFAULT_LLM_MODEL
+        # model is validated by FastAPI and always passed explicitly by batch evaluation;
+        # language is not, so the programmatic path would otherwise see its Query default.
+        if isinstance(language, QueryType):
+            language = language.default
 
         # Ensure parallel_chunking and max_parallel_workers are proper types, not Query objects
         if isinstance(parallel_chunking, QueryType):
@@ -72,168 +185,154 @@ async def evaluate_author(
             max_parallel_workers = max_parallel_workers.default
         max_parallel_workers = int(max_parallel_workers)
 
-        # Check data directory
+        # Inputs besides the commits that a cached evaluation must match to be reused
+        cache_key = evaluation_cache_key(
+            plugin_id, meta.version if meta else "", model, language, get_scan_module_digest(scan_path)
+        )
+
         data_dir = get_platform_data_dir(platform, owner, repo)
-        if not data_dir.exists():
-            raise HTTPException(status_code=404, detail=f"No local data found for {platform}/{owner}/{repo}. Please extract data first.")
+
+        # Request-invariant lookups, shared by the alias and single-author paths
+        api_key = get_llm_api_key()
+        if not api_key:
+            raise HTTPException(status_code=500, detail="LLM not configured")
+        eval_dir = get_platform_eval_dir(platform, owner, repo)
+        default_plugin_id = get_plugins_snapshot()[1]
+        evaluator_factory = _make_evaluator_factory(
+            scan_mod,
+            data_dir=str(data_dir),
+            api_key=api_key,
+            model=model,
+            mode="moderate",
+            language=language,
+            parallel_chunking=parallel_chunking,
+            max_parallel_workers=max_parallel_workers,
+        )
+
+        def _run_eval(name: str, commits: list, name_aliases: Optional[List[str]]) -> Dict[str, Any]:
+            """Evaluate one identity incrementally against its cached evaluation, then save it."""
+            eval_path = get_evaluation_cache_path(eval_dir, name, plugin_id, default_plugin_id)
+            previous_evaluation = load_cached_evaluation(eval_path, cache_key) if use_cache else None
+
+            def _lookup(fingerprint: str) -> Optional[Dict[str, Any]]:
+                # Other identities only: an expired own file must not come back through here
+                return find_evaluation_by_fingerprint(
+                    eval_dir, fingerprint, plugin_id, cache_key, exclude_path=eval_path
+                )
+
+            evaluation = evaluate_author_incremental(
+                commits=commits,
+                author=name,
+                previous_evaluation=previous_evaluation,
+                data_dir=data_dir,
+                model=model,
+                use_chunking=use_chunking,
+                api_key=api_key,
+                aliases=name_aliases,
+                evaluator_factory=evaluator_factory,
+                parallel_chunking=parallel_chunking,
+                max_parallel_workers=max_parallel_workers,
+                equivalent_evaluation_lookup=_lookup if use_cache else None,
+                cache_key=cache_key,
+            )
+            evaluation["plugin"] = plugin_id
+            evaluation["cache_key"] = cache_key
+            if meta:
+                evaluation["plugin_version"] = meta.version
+
+            if use_cache:
+                _save_evaluation(eval_path, evaluation)
+            return evaluation
 
         # Handle multi-alias evaluation
         if aliases and len(aliases) > 1:
             print(f"[Aliases] Evaluating {len(aliases)} identities separately then merging...")
-            evaluations_to_merge = []
-            default_plugin_id = get_plugins_snapshot()[1]
 
-            for alias in aliases:
-                print(f"[Aliases] Evaluating identity: {alias}")
-                commits = load_commits_from_local(data_dir, limit=None)
-                if not commits:
-                    continue
+            # Aliases only filter the same commit set; load it once for all identities.
+            commits = await asyncio.to_thread(
+                _load_local_commits, data_dir, platform, owner, repo, "No commits found for any aliases"
+            )
 
-                # Load previous evaluation
-                eval_dir = get_platform_eval_dir(platform, owner, repo)
-                eval_path = get_evaluation_cache_path(eval_dir, alias, plugin_id, default_plugin_id)
-                previous_evaluation = None
-
-                if use_cache and eval_path.exists():
-                    try:
-                        with open(eval_path, 'r', encoding='utf-8') as f:
-                            previous_evaluation = json.load(f)
-                    except Exception as e:
-                        print(f"[Aliases] ⚠ Failed to load cached evaluation: {e}")
-
-                # Evaluate
-                api_key = get_llm_api_key()
-                if not api_key:
-                    raise HTTPException(status_code=500, detail="LLM not configured")
-
-                def _factory():
-                    return scan_mod.create_commit_evaluator(
-                        data_dir=str(data_dir),
-                        api_key=api_key,
-                        model=model,
-                        mode="moderate",
-                        language=language,
-                        parallel_chunking=parallel_chunking,
-                        max_parallel_workers=max_parallel_workers,
-                    )
-
-                evaluation = evaluate_author_incremental(
-                    commits=commits,
-                    author=alias,
-                    previous_evaluation=previous_evaluation,
-                    data_dir=data_dir,
-                    model=model,
-                    use_chunking=use_chunking,
-                    api_key=api_key,
-                    aliases=[alias],
-                    evaluator_factory=_factory,
-                    parallel_chunking=parallel_chunking,
-                    max_parallel_workers=max_parallel_workers,
-                )
-                evaluation["plugin"] = plugin_id
-                if meta:
-                    evaluation["plugin_version"] = meta.version
-
-                # Save
-                if use_cache:
-                    eval_path.parent.mkdir(parents=True, exist_ok=True)
-                    with open(eval_path, 'w', encoding='utf-8') as f:
-                        json.dump(evaluation, f, indent=2, ensure_ascii=False)
-
-                alias_commits = [c for c in commits if any(a.lower() in str(c.get("author", "")).lower() for a in [alias])]
-                evaluations_to_merge.append({
-                    "author": alias,
-                    "weight": len(alias_commits),
-                    "evaluation": evaluation
-                })
+            # Merge weights match aliases against each commit's author; lowercase those once.
+            authors_lower = [str(c.get("author", "")).lower() for c in commits]
+            # One pass over the commits serves every alias's filter
+            author_index = build_author_index(commits)
 
-            # Merge
-            if len(evaluations_to_merge) >= 2:
-                merged_eval = merge_evaluations_logic(evaluations_to_merge, model)
-                return {
-                    "success": True,
-                    "evaluation": merged_eval,
-                    "metadata": {"cached": False, "timestamp": datetime.now().isoformat(), "source": "merged_aliases"}
-                }
-            elif len(evaluations_to_merge) == 1:
+            def _evaluate_alias(alias: str) -> Dict[str, Any]:
+                print(f"[Aliases] Evaluating identity: {alias}")
+                alias_commits = select_commits_by_authors(commits, author_index, [alias])
+                evaluation = _run_eval(alias, alias_commits, [alias])
+                alias_lower = alias.lower()
                 return {
-                    "success": True,
-                    "evaluation": evaluations_to_merge[0]["evaluation"],
-                    "metadata": {"cached": False, "timestamp": datetime.now().isoformat(), "source": "single_alias"}
+                    "author": alias,
+                    "weight": sum(1 for name in authors_lower if alias_lower in name),
+                    "evaluation": evaluation
                 }
-            else:
-                raise HTTPException(status_code=404, detail="No commits found for any aliases")
 
-        # Single author evaluation
-        print(f"[Evaluation] Loading commits for {author}...")
-        commits = load_commits_from_local(data_dir, limit=None)
-        if not commits:
-            raise HTTPException(status_code=404, detail=f"No commits found in local data for {owner}/{repo}")
+            alias_slots = asyncio.Semaphore(get_alias_concurrency(_MAX_ALIAS_WORKERS))
 
-        # Load previous evaluation
-        eval_dir = get_platform_eval_dir(platform, owner, repo)
-        default_plugin_id = get_plugins_snapshot()[1]
-        eval_path = get_evaluation_cache_path(eval_dir, author, plugin_id, default_plugin_id)
-        previous_evaluation = None
+            async def _evaluate_alias_bounded(alias: str) -> Dict[str, Any]:
+                async with alias_slots:
+                    return await asyncio.to_thread(_evaluate_alias, alias)
 
-        if use_cache and eval_path.exists():
+            # The first identity runs alone so the provider's prompt-prefix cache is warm;
+            # the remaining identities are independent network-bound calls.
+            # Every identity, warm-up included, is dropped the same way when it fails.
             try:
-                with open(eval_path, 'r', encoding='utf-8') as f:
-                    previous_evaluation = json.load(f)
+                results = [await asyncio.to_thread(_evaluate_alias, aliases[0])]
+            except HTTPException:
+                raise
             except Exception as e:
-                print(f"[Evaluation] ⚠ Failed to load previous evaluation: {e}")
+                results = [e]
+            results += await asyncio.gather(
+                *(_evaluate_alias_bounded(a) for a in aliases[1:]), return_exceptions=True
+            )
+            evaluations_to_merge = []
+            last_error: Optional[Exception] = None
+            for alias, result in zip(aliases, results):
+                if isinstance(result, HTTPException):
+                    raise result
+                if isinstance(result, Exception):
+                    print(f"[Aliases] ✗ Evaluation failed for {alias}, merging without it: {result}")
+                    last_error = result
+                    continue
+                evaluations_to_merge.append(result)
 
-        # Evaluate
-        api_key = get_llm_api_key()
-        if not api_key:
-            raise HTTPException(status_code=500, detail="LLM not configured")
+            if not evaluations_to_merge:
+                raise HTTPException(status_code=502, detail=f"LLM evaluation failed for every alias: {last_error}")
 
-        def _factory():
-            return scan_mod.create_commit_evaluator(
-                data_dir=str(data_dir),
-                api_key=api_key,
-                model=model,
-                mode="moderate",
-                language=language,
-                parallel_chunking=parallel_chunking,
-                max_parallel_workers=max_parallel_workers,
-            )
+            # Merge
+            if len(evaluations_to_merge) >= 2:
+                merged_eval = merge_evaluations_logic(evaluations_to_merge, model)
+                return _evaluation_response(merged_eval, source="merged_aliases")
+            return _evaluation_response(evaluations_to_merge[0]["evaluation"], source="single_alias")
 
-        evaluation = evaluate_author_incremental(
-            commits=commits,
-            author=author,
-            previous_evaluation=previous_evaluation,
-            data_dir=data_dir,
-            model=model,
-            use_chunking=use_chunking,
-            api_key=api_key,
-            aliases=aliases,
-            evaluator_factory=_factory,
-            parallel_chunking=parallel_chunking,
-            max_parallel_workers=max_parallel_workers,
+        # Single author evaluation
+        eval_path = get_evaluation_cache_path(eval_dir, author, plugin_id, default_plugin_id)
+        if use_cache:
+            memoized = _get_memoized_result(_result_memo_key(eval_path, data_dir, cache_key, aliases))
+            if memoized is not None:
+                print(f"[Evaluation] {author}: data and cached evaluation unchanged, reusing result")
+                return _evaluation_response(memoized, cached=True, source="memory")
+
+        print(f"[Evaluation] Loading commits for {author}...")
+        # Disk I/O and the LLM run go to worker threads so the event loop keeps serving requests.
+        commits = await asyncio.to_thread(
+            _load_local_commits, data_dir, platform, owner, repo, f"No commits found in local data for {owner}/{repo}"
         )
-        evaluation["plugin"] = plugin_id
-        if meta:
-            evaluation["plugin_version"] = meta.version
+        # Keep only this author's commits alive during the (long) LLM evaluation.
+        commits = filter_commits_by_authors(commits, aliases or [author])
 
-        # Save
+        evaluation = await asyncio.to_thread(_run_eval, author, commits, aliases)
         if use_cache:
-            eval_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(eval_path, 'w', encoding='utf-8') as f:
-                json.dump(evaluation, f, indent=2, ensure_ascii=False)
+            _memoize_result(_result_memo_key(eval_path, data_dir, cache_key, aliases), evaluation)
 
-        return {
-            "success": True,
-            "evaluation": evaluation,
-            "metadata": {"cached": False, "timestamp": datetime.now().isoformat()}
-        }
+        return _evaluation_response(evaluation)
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Evaluation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("✗ Evaluation failed for %s/%s/%s", owner, repo, author)
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
 
@@ -265,15 +364,21 @@ async def evaluate_gitee_contributor(
     platform = "gitee"
 
     try:
-        # Get commits
-        commits = fetch_gitee_commits(owner, repo, 500, is_enterprise)
+        # Fetch commits in the background; the plugin load below overlaps the network round trips
+        commits_task = asyncio.create_task(asyncio.to_thread(fetch_gitee_commits, owner, repo, 500, is_enterprise))
 
         # Load plugin
-        plugin_id = resolve_plugin_id(plugin)
-        meta, scan_mod, scan_path = load_scan_module(plugin_id)
-        api_key = get_llm_api_key()
-        if not api_key:
-            raise HTTPException(status_code=500, detail="LLM not configured")
+        try:
+            plugin_id = resolve_plugin_id(plugin)
+            meta, scan_mod, scan_path = load_scan_module(plugin_id)
+            api_key = get_llm_api_key()
+            if not api_key:
+                raise HTTPException(status_code=500, detail="LLM not configured")
+        except BaseException:
+            commits_task.cancel()
+            raise
+
+        commits = await commits_task
 
         evaluator = scan_mod.create_commit_evaluator(
             data_dir=str(get_repo_data_dir(platform, owner, repo)),
@@ -283,38 +388,36 @@ async def evaluate_gitee_contributor(
         )
 
         # Evaluate
+        check_llm_budget(commits, limit)
+        await asyncio.to_thread(acquire_llm_capacity, commits, limit, contributor)
         try:
-            evaluation = evaluator.evaluate_engineer(
+            evaluation = await asyncio.to_thread(
+                evaluator.evaluate_engineer,
                 commits=commits,
                 username=contributor,
                 max_commits=limit,
                 load_files=True
             )
+            record_llm_usage(evaluation, contributor)
         except Exception as e:
             raise HTTPException(status_code=502, detail=f"LLM evaluation failed: {str(e)}")
 
         if not evaluation or "scores" not in evaluation:
             raise HTTPException(status_code=404, detail=f"Contributor '{contributor}' not found")
 
-        return {
-            "success": True,
-            "evaluation": {
-                "username": evaluation.get("username", contributor),
-                "mode": evaluation.get("mode", "moderate"),
-                "total_commits_analyzed": evaluation.get("total_commits_analyzed", 0),
-                "files_loaded": evaluation.get("files_loaded", 0),
-                "scores": evaluation.get("scores", {}),
-                "commits_summary": evaluation.get("commits_summary", {}),
-                "plugin": plugin_id,
-                "plugin_version": meta.version,
-            },
-            "metadata": {"cached": False, "timestamp": datetime.now().isoformat()}
-        }
+        return _evaluation_response({
+            "username": evaluation.get("username", contributor),
+            "mode": evaluation.get("mode", "moderate"),
+            "total_commits_analyzed": evaluation.get("total_commits_analyzed", 0),
+            "files_loaded": evaluation.get("files_loaded", 0),
+            "scores": evaluation.get("scores", {}),
+            "commits_summary": evaluation.get("commits_summary", {}),
+            "plugin": plugin_id,
+            "plugin_version": meta.version,
+        })
 
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Evaluation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("✗ Gitee evaluation failed for %s/%s/%s", owner, repo, contributor)
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
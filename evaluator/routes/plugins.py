@@ -1,18 +1,29 @@
 """Plugin management routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from evaluator.services import get_plugins_snapshot
+from evaluator.services.plugin_service import PluginsSnapshot
 
 router = APIRouter()
 
 
+async def plugins_dep() -> PluginsSnapshot:
+    """
+    Plugin snapshot for the routes that list plugins.
+
+    Discovery happens on first use here (or on the first evaluation), never at import time,
+    so health/config polling does not wake the plugin machinery.
+    """
+    return get_plugins_snapshot()
+
+
 @router.get("/api/plugins")
-async def list_plugins():
+async def list_plugins(snapshot: PluginsSnapshot = Depends(plugins_dep)):
     """
     List available scan plugins discovered from the local `plugins/` directory.
     """
-    plugins, default_id = get_plugins_snapshot()
+    plugins, default_id = snapshot
     print(f"[Info] Discovered {len(plugins)} plugins, default={default_id}")
     return {
         "success": True,
@@ -26,22 +37,21 @@ async def list_plugins():
                 "default": bool(meta.default),
                 "scan_entry": meta.scan_entry,
                 "view_single_entry": meta.view_single_entry,
-                "has_view_single": bool((plugin_dir / meta.view_single_entry).exists()),
+                "has_view_single": meta.has_view_single,
                 "view_compare_entry": meta.view_compare_entry,
-                "has_view_compare": bool((plugin_dir / meta.view_compare_entry).exists()),
+                "has_view_compare": meta.has_view_compare,
                 # Legacy (compat) single-view entry
                 "view_entry": meta.view_entry,
-                "has_view": bool((plugin_dir / meta.view_entry).exists()),
+                "has_view": meta.has_view,
             }
-            for meta, plugin_dir in plugins
+            for meta, _ in plugins
         ],
     }
 
 
 @router.get("/api/plugins/default")
-async def get_default_plugin():
+async def get_default_plugin(snapshot: PluginsSnapshot = Depends(plugins_dep)):
     """Get default plugin ID."""
-    plugins, default_id = get_plugins_snapshot()
-    _ = plugins
+    _, default_id = snapshot
 
     return {"success": True, "default": default_id}
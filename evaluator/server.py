@@ -3,12 +3,15 @@
 FastAPI Backend for Engineer Skill Evaluator
 """
 
+import asyncio
 import os
 import json
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
@@ -52,7 +55,22 @@ if user_env_path.exists():
     load_dotenv(str(user_env_path), override=False)
 load_dotenv(override=False)
 
-app = FastAPI(title="Engineer Skill Evaluator API")
+# Worker threads behind asyncio.to_thread. Evaluations park a thread on LLM calls for minutes,
+# so the pool is sized for blocking I/O rather than the interpreter default of cpu_count + 4.
+_DEFAULT_EXECUTOR_WORKERS = 32
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    executor = ThreadPoolExecutor(max_workers=_DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="oscanner")
+    asyncio.get_running_loop().set_default_executor(executor)
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+app = FastAPI(title="Engineer Skill Evaluator API", lifespan=_lifespan)
 
 # Middleware to strip trailing slashes from API requests
 # (Next.js uses trailingSlash: true for static export, but FastAPI routes don't have trailing slashes)
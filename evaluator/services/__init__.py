@@ -4,6 +4,7 @@ from evaluator.services.plugin_service import (
     get_plugins_snapshot,
     resolve_plugin_id,
     get_evaluation_cache_path,
+    get_scan_module_digest,
 )
 from evaluator.services.extraction_service import (
     extract_github_data,
@@ -16,8 +17,21 @@ from evaluator.services.evaluation_service import (
     get_or_create_evaluator,
     evaluate_author_incremental,
     get_empty_evaluation,
+    find_evaluation_by_fingerprint,
+    evaluation_cache_key,
+    load_cached_evaluation,
+    evaluation_age_if_expired,
 )
 from evaluator.services.merge_service import merge_evaluations_logic
+from evaluator.services.budget_service import (
+    get_budget_tracker,
+    check_llm_budget,
+    record_llm_usage,
+)
+from evaluator.services.rate_limit_service import (
+    get_llm_rate_limiter,
+    acquire_llm_capacity,
+)
 from evaluator.services.trajectory_service import (
     load_trajectory_cache,
     save_trajectory_cache,
@@ -29,6 +43,7 @@ __all__ = [
     "get_plugins_snapshot",
     "resolve_plugin_id",
     "get_evaluation_cache_path",
+    "get_scan_module_digest",
     "extract_github_data",
     "extract_gitee_data",
     "fetch_github_commits",
@@ -37,7 +52,16 @@ __all__ = [
     "get_or_create_evaluator",
     "evaluate_author_incremental",
     "get_empty_evaluation",
+    "find_evaluation_by_fingerprint",
+    "evaluation_cache_key",
+    "load_cached_evaluation",
+    "evaluation_age_if_expired",
     "merge_evaluations_logic",
+    "get_budget_tracker",
+    "check_llm_budget",
+    "record_llm_usage",
+    "get_llm_rate_limiter",
+    "acquire_llm_capacity",
     "load_trajectory_cache",
     "save_trajectory_cache",
     "analyze_growth_trajectory",
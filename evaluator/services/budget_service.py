@@ -0,0 +1,168 @@
+"""LLM spend tracking with an append-only log and an optional hard ceiling."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+from fastapi import HTTPException
+
+from evaluator.config import get_llm_budget_usd, get_llm_price_per_mtok
+from evaluator.paths import get_budget_log_path
+from evaluator.services.rate_limit_service import estimate_evaluation_tokens
+
+
+def _usage_tokens(usage: Dict[str, Any]) -> int:
+    return int(usage.get("prompt_tokens") or 0) + int(usage.get("completion_tokens") or 0)
+
+
+class BudgetTracker:
+    """
+    Process-wide LLM spend accumulator backed by an append-only JSONL log.
+
+    Entries are only ever appended (O_APPEND, one write per line), so the log doubles as an
+    audit trail; the running total is rebuilt from it on first use after a restart.
+
+    Provider-reported costs also give an observed USD-per-token rate, used to price the next
+    evaluation before it starts when no fallback price is configured.
+    """
+
+    def __init__(self, log_path: Path):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._spent: Optional[float] = None
+        self._reported_cost = 0.0
+        self._reported_tokens = 0
+        self._warned_uncosted = False
+
+    @property
+    def spent(self) -> float:
+        with self._lock:
+            return self._load_spent()
+
+    def _load_spent(self) -> float:
+        if self._spent is not None:
+            return self._spent
+        total = 0.0
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        cost = float(entry.get("cost") or 0.0)
+                        total += cost
+                        if cost > 0 and not entry.get("estimated"):
+                            self._reported_cost += cost
+                            self._reported_tokens += _usage_tokens(entry.get("usage") or {})
+                    except (ValueError, TypeError, AttributeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Budget] ⚠ Failed to read spend log {self.log_path}: {e}")
+        self._spent = total
+        return total
+
+    def record(
+        self, usage: Dict[str, Any], author: str, price_per_mtok: Optional[float] = None
+    ) -> Tuple[float, float]:
+        """
+        Append one evaluation's usage to the log; returns (its cost, new running total) in USD.
+
+        Usage with tokens but no reported cost is priced at price_per_mtok (logged with
+        "estimated": true); without a price it counts as free (warned once if a ceiling is set).
+        """
+        cost = float(usage.get("cost") or 0.0)
+        tokens = _usage_tokens(usage)
+        uncosted = cost <= 0 and tokens > 0
+        entry = {"ts": time.time(), "author": author, "cost": cost, "usage": usage}
+        if uncosted and price_per_mtok is not None:
+            cost = tokens * price_per_mtok / 1e6
+            entry["cost"] = cost
+            entry["estimated"] = True
+        elif uncosted and not self._warned_uncosted and get_llm_budget_usd() is not None:
+            self._warned_uncosted = True
+            print("[Budget] ⚠ LLM endpoint reports no cost; OSCANNER_LLM_BUDGET_USD cannot be enforced "
+                  "(set OSCANNER_LLM_PRICE_PER_MTOK to estimate spend from token counts)")
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            spent = self._load_spent() + cost
+            self._spent = spent
+            if cost > 0 and "estimated" not in entry:
+                self._reported_cost += cost
+                self._reported_tokens += tokens
+            try:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+            except Exception as e:
+                print(f"[Budget] ⚠ Failed to append spend log: {e}")
+        return cost, spent
+
+    def estimate_cost(self, tokens: int, price_per_mtok: Optional[float] = None) -> float:
+        """USD for tokens at price_per_mtok, else at the observed rate (0.0 if none yet)."""
+        if price_per_mtok is not None:
+            return tokens * price_per_mtok / 1e6
+        with self._lock:
+            self._load_spent()
+            if not self._reported_tokens:
+                return 0.0
+            return tokens * self._reported_cost / self._reported_tokens
+
+    def check(self, ceiling_usd: Optional[float], estimated_cost: float = 0.0) -> None:
+        """Raise 402 if the ceiling is set and reached, or the next call would exceed it."""
+        if ceiling_usd is None:
+            return
+        spent = self.spent
+        if spent >= ceiling_usd or spent + estimated_cost > ceiling_usd:
+            raise HTTPException(
+                status_code=402,
+                detail=(
+                    f"LLM budget exhausted: spent ${spent:.4f} of ${ceiling_usd:.4f}, next evaluation "
+                    f"estimated at ${estimated_cost:.4f} (OSCANNER_LLM_BUDGET_USD)"
+                ),
+            )
+
+
+_tracker: Optional[BudgetTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_budget_tracker() -> BudgetTracker:
+    """Return the process-wide tracker (created on first use)."""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = BudgetTracker(get_budget_log_path())
+    return _tracker
+
+
+def check_llm_budget(commits: Iterable[Dict[str, Any]] = (), max_commits: int = 0) -> None:
+    """
+    Refuse to start an LLM evaluation of up to max_commits commits that the configured ceiling
+    cannot cover (spent + estimated cost of this evaluation).
+    """
+    ceiling = get_llm_budget_usd()
+    if ceiling is None:
+        return
+    tracker = get_budget_tracker()
+    estimated = tracker.estimate_cost(estimate_evaluation_tokens(commits, max_commits), get_llm_price_per_mtok())
+    tracker.check(ceiling, estimated)
+
+
+def record_llm_usage(evaluation: Dict[str, Any], author: str) -> None:
+    """
+    Move the plugin-reported `llm_usage` out of an evaluation result into the spend log.
+
+    Plugins that do not report usage are ignored.
+    """
+    usage = evaluation.pop("llm_usage", None) if isinstance(evaluation, dict) else None
+    if not isinstance(usage, dict) or not usage.get("calls"):
+        return
+    cost, spent = get_budget_tracker().record(usage, author, get_llm_price_per_mtok())
+    print(f"[Budget] {author}: ${cost:.4f} this evaluation, ${spent:.4f} total")
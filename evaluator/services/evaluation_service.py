@@ -1,18 +1,21 @@
 """Evaluation orchestration service."""
 
-import json
+import hashlib
 import threading
 import time
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 from fastapi import HTTPException
 
-from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL
+from evaluator.config import get_llm_api_key, get_eval_cache_ttl_seconds, get_llm_cache_policy, DEFAULT_LLM_MODEL
 from evaluator.plugin_registry import load_scan_module
-from evaluator.utils import is_commit_by_author
+from evaluator.utils import dumps_json, filter_commits_by_authors, iter_json_paths, loads_json, write_json_atomic
 from evaluator.services.plugin_service import resolve_plugin_id
 from evaluator.services.extraction_service import get_repo_data_dir
+from evaluator.services.budget_service import check_llm_budget, record_llm_usage
+from evaluator.services.rate_limit_service import acquire_llm_capacity
 
 
 def get_or_create_evaluator(
@@ -35,8 +38,7 @@ def get_or_create_evaluator(
 
     # Create commits_index.json
     commits_index = [{"sha": c.get("sha"), "hash": c.get("sha")} for c in commits]
-    with open(data_dir / "commits_index.json", "w", encoding="utf-8") as f:
-        json.dump(commits_index, f, indent=2, ensure_ascii=False)
+    (data_dir / "commits_index.json").write_bytes(dumps_json(commits_index, indent=False))
 
     # Save individual commits
     commits_dir = data_dir / "commits"
@@ -44,13 +46,11 @@ def get_or_create_evaluator(
     for commit in commits:
         sha = commit.get("sha")
         if sha:
-            with open(commits_dir / f"{sha}.json", "w", encoding="utf-8") as f:
-                json.dump(commit, f, indent=2, ensure_ascii=False)
+            (commits_dir / f"{sha}.json").write_bytes(dumps_json(commit, indent=False))
 
     # repo_info.json
     repo_info = {"name": f"{owner}/{repo}", "full_name": f"{owner}/{repo}", "owner": owner, "platform": platform}
-    with open(data_dir / "repo_info.json", "w", encoding="utf-8") as f:
-        json.dump(repo_info, f, indent=2, ensure_ascii=False)
+    (data_dir / "repo_info.json").write_bytes(dumps_json(repo_info))
 
     pid = resolve_plugin_id(plugin_id)
     meta, scan_mod, scan_path = load_scan_module(pid)
@@ -71,6 +71,275 @@ def get_or_create_evaluator(
     return evaluator
 
 
+def commits_fingerprint(commits: List[Dict[str, Any]]) -> str:
+    """Order-independent digest of a commit set (by SHA); equal sets evaluate identically."""
+    shas = sorted(str(c.get("sha") or c.get("hash") or "") for c in commits)
+    return hashlib.blake2b("\n".join(shas).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _commit_shas(commits: List[Dict[str, Any]]) -> List[str]:
+    return [str(c.get("sha") or c.get("hash") or "") for c in commits]
+
+
+# Share of the previously covered commits that must still be present for a delta evaluation
+_DELTA_MIN_RETAINED = 0.8
+
+
+def _delta_commits(
+    author_commits: List[Dict[str, Any]], prev_shas: List[str]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Commits not covered by a previous evaluation, or None when a delta would be unsound.
+
+    author_commits is newest first, so genuinely new commits form a contiguous prefix. Anything
+    else (unknown commits interleaved with known ones, or most of the previously covered
+    commits gone, e.g. after a history rewrite) calls for a full re-evaluation.
+    """
+    known = set(prev_shas)
+    shas = _commit_shas(author_commits)
+    new_count = 0
+    while new_count < len(shas) and shas[new_count] not in known:
+        new_count += 1
+    if any(sha not in known for sha in shas[new_count:]):
+        return None
+    retained = len(known.intersection(shas[new_count:]))
+    if retained < _DELTA_MIN_RETAINED * len(known):
+        return None
+    return author_commits[:new_count]
+
+
+def evaluation_cache_key(
+    plugin_id: str,
+    plugin_version: str,
+    model: str,
+    language: str,
+    prompt_digest: str = "",
+) -> str:
+    """
+    Digest of the non-commit inputs that shape an evaluation.
+
+    Stored in each cached evaluation; a cache written under different inputs (plugin upgrade,
+    edited prompt/rubric, another model or language) is not reused. New commits are handled
+    incrementally instead.
+    """
+    raw = "\x1f".join((plugin_id or "", plugin_version or "", model or "", language or "", prompt_digest or ""))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Raw LLM results, content-addressed, under <data_dir>/.llm_cache/<key>.json
+_LLM_CACHE_DIR_NAME = ".llm_cache"
+
+
+def llm_result_cache_path(
+    data_dir: Path,
+    cache_key: str,
+    username: str,
+    commits: List[Dict[str, Any]],
+    max_commits: int,
+    use_chunking: bool,
+) -> Path:
+    """
+    Where the LLM result for exactly these evaluate_engineer inputs is stored.
+
+    cache_key (see evaluation_cache_key) covers plugin, prompt digest, model and language;
+    the commit SHAs are hashed in order since the evaluator keeps the first max_commits.
+    """
+    h = hashlib.sha256()
+    for part in (cache_key, username, str(max_commits), "1" if use_chunking else "0"):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    for c in commits:
+        h.update(str(c.get("sha") or c.get("hash") or "").encode("utf-8"))
+        h.update(b"\n")
+    return data_dir / _LLM_CACHE_DIR_NAME / f"{h.hexdigest()}.json"
+
+
+def _load_llm_result(path: Optional[Path], policy: str) -> Optional[Dict[str, Any]]:
+    """
+    Stored LLM result for path, honoring the cache policy (replay turns a miss into a 409).
+
+    Results older than the evaluation cache TTL (by file mtime) count as a miss, except under
+    replay, which must reproduce whatever was recorded.
+    """
+    if path is None or policy == "disabled":
+        return None
+    ttl_seconds = get_eval_cache_ttl_seconds() if policy != "replay" else None
+    try:
+        age = time.time() - path.stat().st_mtime
+        if ttl_seconds is not None and age > ttl_seconds:
+            print(f"[LLMCache] Stored result {path.name[:12]} expired ({int(age // 86400)}d old), ignoring")
+            return None
+        with open(path, 'rb') as f:
+            data = loads_json(f.read())
+    except FileNotFoundError:
+        data = None
+    except Exception as e:
+        print(f"[LLMCache] ⚠ Ignoring unreadable {path.name}: {e}")
+        data = None
+    if isinstance(data, dict):
+        print(f"[LLMCache] Hit {path.name[:12]}, skipping LLM call")
+        return data
+    if policy == "replay":
+        raise HTTPException(status_code=409, detail="No stored LLM result for these inputs (OSCANNER_LLM_CACHE=replay)")
+    return None
+
+
+def _store_llm_result(path: Optional[Path], policy: str, evaluation: Dict[str, Any]) -> None:
+    if path is None or policy != "enabled":
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(path, evaluation, indent=False)
+    except Exception as e:
+        print(f"[LLMCache] ⚠ Failed to store {path.name}: {e}")
+
+
+def load_cached_evaluation(
+    eval_path: Path,
+    cache_key: str,
+    ttl_seconds: Optional[float] = -1,
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached evaluation if it was produced under the same inputs and is not expired.
+
+    Legacy caches without a cache_key (or evaluated_at) are accepted. A stale file is left on
+    disk (it is overwritten by the next save) but not returned.
+
+    Args:
+        ttl_seconds: Max age; -1 uses OSCANNER_EVAL_CACHE_TTL_DAYS, None disables expiry
+    """
+    try:
+        with open(eval_path, 'rb') as f:
+            data = loads_json(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Evaluation] ⚠ Failed to load cached evaluation {eval_path.name}: {e}")
+        return None
+    if not isinstance(data, dict):
+        return None
+    stored_key = data.get("cache_key")
+    if stored_key and stored_key != cache_key:
+        print(f"[Evaluation] Cached evaluation {eval_path.name} was built with different inputs, ignoring")
+        return None
+    age = evaluation_age_if_expired(data, ttl_seconds)
+    if age is not None:
+        print(f"[Evaluation] Cached evaluation {eval_path.name} expired ({int(age // 86400)}d old), ignoring")
+        return None
+    return data
+
+
+def evaluation_age_if_expired(evaluation: Dict[str, Any], ttl_seconds: Optional[float] = -1) -> Optional[float]:
+    """
+    Age in seconds of an evaluation older than the TTL, or None while it is still fresh.
+
+    Evaluations without a parseable evaluated_at never expire.
+
+    Args:
+        ttl_seconds: Max age; -1 uses OSCANNER_EVAL_CACHE_TTL_DAYS, None disables expiry
+    """
+    if ttl_seconds == -1:
+        ttl_seconds = get_eval_cache_ttl_seconds()
+    evaluated_at = evaluation.get("evaluated_at")
+    if ttl_seconds is None or not isinstance(evaluated_at, str):
+        return None
+    try:
+        age = (datetime.now() - datetime.fromisoformat(evaluated_at)).total_seconds()
+    except ValueError:
+        return None
+    return age if age > ttl_seconds else None
+
+
+def find_evaluation_by_fingerprint(
+    eval_dir: Path,
+    fingerprint: str,
+    plugin_id: str,
+    cache_key: Optional[str] = None,
+    exclude_path: Optional[Path] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a cached evaluation (same plugin) whose author had exactly this commit set.
+
+    Aliases and display-name variants of one person resolve to the same commits, so their
+    evaluation can be reused instead of paying for another LLM run. Expired evaluations (see
+    evaluation_age_if_expired) and exclude_path, the requesting identity's own cache file,
+    are skipped.
+    """
+    if not eval_dir.exists():
+        return None
+    exclude = str(exclude_path) if exclude_path is not None else None
+    for path in iter_json_paths(eval_dir):
+        if path == exclude:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                data = loads_json(f.read())
+        except Exception:
+            continue
+        if (
+            isinstance(data, dict)
+            and data.get("commits_fingerprint") == fingerprint
+            and data.get("plugin") == plugin_id
+            and (cache_key is None or data.get("cache_key") == cache_key)
+            and evaluation_age_if_expired(data) is None
+        ):
+            return data
+    return None
+
+
+def _run_llm_evaluation(
+    commits: List[Dict[str, Any]],
+    author: str,
+    max_commits: int,
+    use_chunking: bool,
+    evaluator_factory,
+    incremental: bool = False,
+) -> Dict[str, Any]:
+    """One evaluate_engineer call with budget/rate checks; usage is moved to the spend log."""
+    check_llm_budget(commits, max_commits)
+    acquire_llm_capacity(commits, max_commits, author)
+    evaluator = evaluator_factory()
+    if incremental and getattr(evaluator, "light_model", None):
+        # A delta holds only the new commits, so plugin routing on it would send every update of
+        # an established contributor to the light model; deltas are scored by the main model.
+        evaluator.light_model = None
+    kind = " incremental" if incremental else ""
+    count = f"new_commits={len(commits)}" if incremental else f"commits={len(commits)}"
+
+    # Heartbeat progress logs: LLM evaluation can take a while with no stdout.
+    stop_event = threading.Event()
+    started_at = time.time()
+
+    def _heartbeat():
+        while not stop_event.wait(15):
+            elapsed = int(time.time() - started_at)
+            print(f"[LLM] Evaluating{kind}... elapsed={elapsed}s (author={author}, {count}, chunking={use_chunking})")
+
+    hb = threading.Thread(target=_heartbeat, daemon=True)
+    hb.start()
+
+    try:
+        print(f"[LLM] Starting{kind} evaluation (author={author}, {count}, chunking={use_chunking})")
+        evaluation = evaluator.evaluate_engineer(
+            commits=commits,
+            username=author,
+            max_commits=max_commits,
+            load_files=True,
+            use_chunking=use_chunking
+        )
+    except Exception as e:
+        stop_event.set()
+        raise HTTPException(status_code=502, detail=f"LLM evaluation failed: {str(e)}")
+    finally:
+        stop_event.set()
+        elapsed = int(time.time() - started_at)
+        finished = "Incremental evaluation" if incremental else "Evaluation"
+        print(f"[LLM] {finished} finished in {elapsed}s (author={author})")
+
+    record_llm_usage(evaluation, author)
+    return evaluation
+
+
 def evaluate_author_incremental(
     commits: List[Dict[str, Any]],
     author: str,
@@ -83,6 +352,8 @@ def evaluate_author_incremental(
     evaluator_factory=None,
     parallel_chunking: bool = True,
     max_parallel_workers: int = 3,
+    equivalent_evaluation_lookup: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+    cache_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Evaluate author incrementally with weighted merge
@@ -96,85 +367,105 @@ def evaluate_author_incremental(
         use_chunking: Whether to enable chunked evaluation
         api_key: LLM API key
         aliases: Optional list of author name aliases (normalized/lowercase)
+        equivalent_evaluation_lookup: Optional callable mapping a commit-set fingerprint to a
+            cached evaluation of another identity with the same commits
+        cache_key: evaluation_cache_key of the other inputs; enables the content-addressed LLM
+            result cache (policy from OSCANNER_LLM_CACHE)
 
     Returns:
         Evaluation result with merged scores
     """
     # Filter commits by author (including aliases)
     if aliases:
-        author_commits = [
-            c for c in commits
-            if any(is_commit_by_author(c, alias) for alias in aliases)
-        ]
+        author_commits = filter_commits_by_authors(commits, aliases)
         print(f"[Incremental] Filtering commits by {len(aliases)} aliases: {aliases}")
     else:
-        author_commits = [c for c in commits if is_commit_by_author(c, author)]
+        author_commits = filter_commits_by_authors(commits, [author])
 
     if not author_commits:
         return get_empty_evaluation(author)
 
+    fingerprint = commits_fingerprint(author_commits)
+
     if evaluator_factory is None:
         raise HTTPException(status_code=500, detail="Evaluator factory not provided (plugin load failed?)")
 
+    def _reevaluate_all() -> Dict[str, Any]:
+        # Pass only this author's commits (re-filtering is idempotent) and keep the caller's options.
+        return evaluate_author_incremental(
+            author_commits,
+            author,
+            None,
+            data_dir,
+            model,
+            use_chunking,
+            api_key,
+            aliases=aliases,
+            evaluator_factory=evaluator_factory,
+            parallel_chunking=parallel_chunking,
+            max_parallel_workers=max_parallel_workers,
+            cache_key=cache_key,
+        )
+
     # Case 1: No previous evaluation → evaluate all commits
+    if not previous_evaluation and equivalent_evaluation_lookup is not None:
+        equivalent = equivalent_evaluation_lookup(fingerprint)
+        # Only another identity's evaluation; our own (e.g. an expired one) is re-evaluated
+        if equivalent and str(equivalent.get("username") or "").lower() != author.lower():
+            print(f"[Incremental] Reusing evaluation of '{equivalent.get('username')}' (identical commit set)")
+            reused = dict(equivalent)
+            reused["username"] = author
+            reused["reused_from"] = equivalent.get("username")
+            # evaluated_at stays the source's, so the copy expires together with the LLM run
+            reused["reused_at"] = datetime.now().isoformat()
+            return reused
+
+    llm_cache_policy = get_llm_cache_policy()
+
     if not previous_evaluation:
         print(f"[Incremental] First evaluation: {len(author_commits)} commits")
 
-        evaluator = evaluator_factory()
-
-        # Heartbeat progress logs: LLM evaluation can take a while with no stdout.
-        stop_event = threading.Event()
-        started_at = time.time()
-
-        def _heartbeat():
-            while not stop_event.wait(15):
-                elapsed = int(time.time() - started_at)
-                print(f"[LLM] Evaluating... elapsed={elapsed}s (author={author}, commits={len(author_commits)}, chunking={use_chunking})")
-
-        hb = threading.Thread(target=_heartbeat, daemon=True)
-        hb.start()
-
-        try:
-            print(f"[LLM] Starting evaluation (author={author}, commits={len(author_commits)}, chunking={use_chunking})")
-            evaluation = evaluator.evaluate_engineer(
-                commits=author_commits,
-                username=author,
-                max_commits=150,
-                load_files=True,
-                use_chunking=use_chunking
-            )
-        except Exception as e:
-            stop_event.set()
-            raise HTTPException(status_code=502, detail=f"LLM evaluation failed: {str(e)}")
-        finally:
-            stop_event.set()
-            elapsed = int(time.time() - started_at)
-            print(f"[LLM] Evaluation finished in {elapsed}s (author={author})")
+        llm_cache_path = (
+            llm_result_cache_path(data_dir, cache_key, author, author_commits, 150, use_chunking)
+            if cache_key else None
+        )
+        evaluation = _load_llm_result(llm_cache_path, llm_cache_policy)
+        if evaluation is None:
+            evaluation = _run_llm_evaluation(author_commits, author, 150, use_chunking, evaluator_factory)
+            _store_llm_result(llm_cache_path, llm_cache_policy, evaluation)
 
         evaluation["last_commit_sha"] = author_commits[0].get("sha") or author_commits[0].get("hash")
         evaluation["total_commits_evaluated"] = len(author_commits) if len(author_commits) <= 150 else 150
         evaluation["new_commits_count"] = evaluation["total_commits_evaluated"]
         evaluation["evaluated_at"] = datetime.now().isoformat()
         evaluation["incremental"] = False
+        evaluation["commits_fingerprint"] = fingerprint
+        evaluation["commit_shas"] = _commit_shas(author_commits)
 
         return evaluation
 
     # Case 2: Find new commits since last evaluation
     last_sha = previous_evaluation.get("last_commit_sha")
-
-    if not last_sha:
+    prev_shas = previous_evaluation.get("commit_shas")
+
+    if isinstance(prev_shas, list) and prev_shas:
+        # Delta against the commit set the previous evaluation covered
+        new_commits = _delta_commits(author_commits, prev_shas)
+        if new_commits is None:
+            print("[Incremental] Commit history diverged from the previous evaluation, re-evaluating all commits")
+            return _reevaluate_all()
+    elif not last_sha:
         # Previous evaluation has no SHA, re-evaluate all
         print(f"[Incremental] No last SHA found, re-evaluating all commits")
-        previous_evaluation = None
-        return evaluate_author_incremental(commits, author, None, data_dir, model, use_chunking, api_key)
-
-    # Find new commits
-    new_commits = []
-    for commit in author_commits:
-        commit_sha = commit.get("sha") or commit.get("hash")
-        if commit_sha == last_sha:
-            break
-        new_commits.append(commit)
+        return _reevaluate_all()
+    else:
+        # Find new commits
+        new_commits = []
+        for commit in author_commits:
+            commit_sha = commit.get("sha") or commit.get("hash")
+            if commit_sha == last_sha:
+                break
+            new_commits.append(commit)
 
     if not new_commits:
         print(f"[Incremental] No new commits since last evaluation")
@@ -183,36 +474,16 @@ def evaluate_author_incremental(
     print(f"[Incremental] Found {len(new_commits)} new commits, evaluating...")
 
     # Evaluate new commits only
-    evaluator = evaluator_factory()
-
-    # Heartbeat progress logs for incremental run
-    stop_event = threading.Event()
-    started_at = time.time()
-
-    def _heartbeat():
-        while not stop_event.wait(15):
-            elapsed = int(time.time() - started_at)
-            print(f"[LLM] Evaluating incremental... elapsed={elapsed}s (author={author}, new_commits={len(new_commits)}, chunking={use_chunking})")
-
-    hb = threading.Thread(target=_heartbeat, daemon=True)
-    hb.start()
-
-    try:
-        print(f"[LLM] Starting incremental evaluation (author={author}, new_commits={len(new_commits)}, chunking={use_chunking})")
-        new_evaluation = evaluator.evaluate_engineer(
-            commits=new_commits,
-            username=author,
-            max_commits=len(new_commits),
-            load_files=True,
-            use_chunking=use_chunking
+    llm_cache_path = (
+        llm_result_cache_path(data_dir, cache_key, author, new_commits, len(new_commits), use_chunking)
+        if cache_key else None
+    )
+    new_evaluation = _load_llm_result(llm_cache_path, llm_cache_policy)
+    if new_evaluation is None:
+        new_evaluation = _run_llm_evaluation(
+            new_commits, author, len(new_commits), use_chunking, evaluator_factory, incremental=True
         )
-    except Exception as e:
-        stop_event.set()
-        raise HTTPException(status_code=502, detail=f"LLM evaluation failed: {str(e)}")
-    finally:
-        stop_event.set()
-        elapsed = int(time.time() - started_at)
-        print(f"[LLM] Incremental evaluation finished in {elapsed}s (author={author})")
+        _store_llm_result(llm_cache_path, llm_cache_policy, new_evaluation)
 
     # Weighted merge of scores
     prev_count = previous_evaluation.get("total_commits_evaluated", 0)
@@ -269,7 +540,7 @@ def evaluate_author_incremental(
         "total_additions": prev_summary.get("total_additions", 0) + new_summary.get("total_additions", 0),
         "total_deletions": prev_summary.get("total_deletions", 0) + new_summary.get("total_deletions", 0),
         "files_changed": prev_summary.get("files_changed", 0) + new_summary.get("files_changed", 0),
-        "languages": list(set(prev_summary.get("languages", []) + new_summary.get("languages", [])))[:10]
+        "languages": list(islice({*prev_summary.get("languages", ()), *new_summary.get("languages", ())}, 10))
     }
 
     return {
@@ -282,6 +553,8 @@ def evaluate_author_incremental(
         "commits_summary": merged_summary,
         "mode": "moderate",
         "incremental": True,
+        "commits_fingerprint": fingerprint,
+        "commit_shas": _commit_shas(author_commits),
         "files_loaded": new_evaluation.get("files_loaded", 0),
         "chunked": new_evaluation.get("chunked", False),
         "chunks_processed": new_evaluation.get("chunks_processed", 0)
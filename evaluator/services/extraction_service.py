@@ -2,15 +2,67 @@
 
 import sys
 import subprocess
-import json
-import requests
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Tuple
 from fastapi import HTTPException
 
 from evaluator.paths import get_platform_data_dir
 from evaluator.config import get_github_token, get_gitee_token
-from evaluator.utils import get_author_from_commit
+from evaluator.utils import dumps_json, get_author_from_commit, get_http_session, loads_json
+
+try:  # run in-process; spawning an interpreter per extraction is only a fallback
+    from evaluator.tools import extract_repo_data_moderate as _moderate_extractor
+except ImportError:
+    _moderate_extractor = None
+
+# Concurrent per-commit detail requests during Gitee extraction (stays under the session pool size).
+_GITEE_DETAIL_WORKERS = 8
+
+
+_EXTRACT_TIMEOUT_SECONDS = 1800
+# Last lines of extractor output kept for the failure message
+_EXTRACT_OUTPUT_TAIL_LINES = 40
+
+
+def _run_extractor_subprocess(cmd: List[str]) -> bool:
+    """Run an extraction tool in a child process, echoing its output live."""
+    # stderr is merged into stdout; only a tail is kept for the failure message
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(_EXTRACT_TIMEOUT_SECONDS, _kill)  # 30 minute timeout
+    timer.start()
+    tail = deque(maxlen=_EXTRACT_OUTPUT_TAIL_LINES)
+    try:
+        for line in proc.stdout:
+            print(f"  [extract] {line}", end="")
+            tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        print("✗ Extraction timeout after 30 minutes")
+        return False
+    if returncode != 0:
+        print(f"✗ Extraction failed (exit {returncode}):\n{''.join(tail)}")
+        return False
+
+    print("✓ Extraction successful")
+    return True
 
 
 def extract_github_data(owner: str, repo: str) -> bool:
@@ -23,11 +75,7 @@ def extract_github_data(owner: str, repo: str) -> bool:
         print(f"Extracting GitHub data for {owner}/{repo}...")
         print(f"{'='*60}")
 
-        # Construct command (module execution; does not rely on CWD)
-        cmd = [
-            sys.executable,
-            "-m",
-            "evaluator.tools.extract_repo_data_moderate",
+        args = [
             "--repo-url",
             repo_url,
             "--out",
@@ -38,22 +86,24 @@ def extract_github_data(owner: str, repo: str) -> bool:
 
         gh_token = get_github_token()
         if gh_token:
-            cmd.extend(["--token", gh_token])
-
-        # Run extraction tool
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 minute timeout
-
-        if result.returncode != 0:
-            print(f"✗ Extraction failed: {result.stderr}")
-            return False
+            args.extend(["--token", gh_token])
+
+        if _moderate_extractor is None:
+            # Module execution; does not rely on CWD
+            cmd = [sys.executable, "-m", "evaluator.tools.extract_repo_data_moderate", *args]
+            return _run_extractor_subprocess(cmd)
+
+        # Run extraction tool (the tool reports errors via sys.exit)
+        try:
+            _moderate_extractor.main(args)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"✗ Extraction failed (exit {e.code})")
+                return False
 
         print(f"✓ Extraction successful")
-        print(result.stdout)
         return True
 
-    except subprocess.TimeoutExpired:
-        print(f"✗ Extraction timeout after 30 minutes")
-        return False
     except Exception as e:
         print(f"✗ Extraction error: {e}")
         import traceback
@@ -61,6 +111,42 @@ def extract_github_data(owner: str, repo: str) -> bool:
         return False
 
 
+# (url, sorted params without credentials) -> (ETag, raw body) of the last 200 response.
+# Recently used entries only: every repo and limit adds a key for the life of the process.
+_ETAG_CACHE_SIZE = 64
+_etag_cache: "OrderedDict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[str, bytes]]" = OrderedDict()
+_etag_cache_lock = threading.Lock()
+
+
+def _get_json_conditional(url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Any:
+    """
+    GET a JSON API resource, revalidating a previously seen response with If-None-Match.
+
+    An unchanged resource comes back as a bodyless 304 (which GitHub does not count against
+    the rate limit) and is served from the stored body. The raw bytes are kept so every
+    caller gets freshly parsed objects it may modify.
+    """
+    key = (url, tuple(sorted((k, v) for k, v in params.items() if k != "access_token")))
+    with _etag_cache_lock:
+        cached = _etag_cache.get(key)
+        if cached is not None:
+            _etag_cache.move_to_end(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+    response = get_http_session().get(url, headers=headers, params=params, timeout=30)
+    if response.status_code == 304 and cached is not None:
+        return loads_json(cached[1])
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    if etag:
+        with _etag_cache_lock:
+            _etag_cache[key] = (etag, response.content)
+            _etag_cache.move_to_end(key)
+            while len(_etag_cache) > _ETAG_CACHE_SIZE:
+                _etag_cache.popitem(last=False)
+    return loads_json(response.content)
+
+
 def fetch_github_commits(owner: str, repo: str, limit: int = 100) -> list:
     """Fetch commits from GitHub API"""
     url = f"https://api.github.com/repos/{owner}/{repo}/commits"
@@ -72,9 +158,7 @@ def fetch_github_commits(owner: str, repo: str, limit: int = 100) -> list:
     params = {"per_page": min(limit, 100)}
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return _get_json_conditional(url, headers, params)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch GitHub commits: {str(e)}")
 
@@ -94,9 +178,7 @@ def fetch_gitee_commits(owner: str, repo: str, limit: int = 100, is_enterprise:
         params["access_token"] = gitee_token
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return _get_json_conditional(url, headers, params)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch Gitee commits: {str(e)}")
 
@@ -124,7 +206,7 @@ def extract_gitee_data(owner: str, repo: str, max_commits: int = 200) -> bool:
             gitee_token = get_gitee_token()
             if gitee_token:
                 params["access_token"] = gitee_token
-            resp = requests.get(api_url, params=params, timeout=30)
+            resp = get_http_session().get(api_url, params=params, timeout=30)
             if resp.status_code != 200:
                 print(f"✗ Gitee commits list failed: {resp.status_code} {resp.text[:200]}")
                 return False
@@ -137,57 +219,56 @@ def extract_gitee_data(owner: str, repo: str, max_commits: int = 200) -> bool:
             page += 1
         commits = commits[:max_commits]
 
-        with open(data_dir / "commits_list.json", "w", encoding="utf-8") as f:
-            json.dump(commits, f, indent=2, ensure_ascii=False)
+        (data_dir / "commits_list.json").write_bytes(dumps_json(commits, indent=False))
 
-        # 2) Fetch per-commit details
-        commits_index = []
-        for c in commits:
-            sha = c.get("sha")
-            if not sha:
-                continue
-            detail_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/commits/{sha}"
-            params = {}
-            gitee_token = get_gitee_token()
-            if gitee_token:
-                params["access_token"] = gitee_token
-            dresp = requests.get(detail_url, params=params, timeout=30)
+        # 2) Fetch per-commit details (requests overlap; results are handled in list order)
+        detail_params: Dict[str, Any] = {}
+        gitee_token = get_gitee_token()
+        if gitee_token:
+            detail_params["access_token"] = gitee_token
+        session = get_http_session()
+
+        def _fetch_detail(c: Dict[str, Any]) -> Any:
+            detail_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/commits/{c['sha']}"
+            dresp = session.get(detail_url, params=detail_params, timeout=30)
             if dresp.status_code != 200:
                 # Fallback to list item
-                detail = c
-            else:
-                detail = dresp.json()
-
-            with open(commits_dir / f"{sha}.json", "w", encoding="utf-8") as f:
-                json.dump(detail, f, indent=2, ensure_ascii=False)
-
-            commit_msg = detail.get("commit", {}).get("message", "") if isinstance(detail, dict) else ""
-            author_name = get_author_from_commit(detail) if isinstance(detail, dict) else ""
-            commit_date = ""
-            if isinstance(detail, dict):
-                commit_date = detail.get("commit", {}).get("author", {}).get("date", "") or detail.get("commit", {}).get("committer", {}).get("date", "")
-            file_list = []
-            if isinstance(detail, dict):
-                file_list = [fi.get("filename") for fi in (detail.get("files") or []) if isinstance(fi, dict) and fi.get("filename")]
-
-            commits_index.append(
-                {
-                    "sha": sha,
-                    "message": (commit_msg.split("\n")[0] if commit_msg else "")[:100],
-                    "author": author_name or "",
-                    "date": commit_date or "",
-                    "files_changed": len(file_list),
-                    "files": file_list,
-                }
-            )
-
-        with open(data_dir / "commits_index.json", "w", encoding="utf-8") as f:
-            json.dump(commits_index, f, indent=2, ensure_ascii=False)
+                return c
+            return dresp.json()
+
+        commits = [c for c in commits if c.get("sha")]
+        commits_index = []
+        with ThreadPoolExecutor(max_workers=_GITEE_DETAIL_WORKERS) as pool:
+            details = pool.map(_fetch_detail, commits)
+            for c, detail in zip(commits, details):
+                sha = c["sha"]
+                (commits_dir / f"{sha}.json").write_bytes(dumps_json(detail, indent=False))
+
+                commit_msg = detail.get("commit", {}).get("message", "") if isinstance(detail, dict) else ""
+                author_name = get_author_from_commit(detail) if isinstance(detail, dict) else ""
+                commit_date = ""
+                if isinstance(detail, dict):
+                    commit_date = detail.get("commit", {}).get("author", {}).get("date", "") or detail.get("commit", {}).get("committer", {}).get("date", "")
+                file_list = []
+                if isinstance(detail, dict):
+                    file_list = [fi.get("filename") for fi in (detail.get("files") or []) if isinstance(fi, dict) and fi.get("filename")]
+
+                commits_index.append(
+                    {
+                        "sha": sha,
+                        "message": (commit_msg or "").partition("\n")[0][:100],
+                        "author": author_name or "",
+                        "date": commit_date or "",
+                        "files_changed": len(file_list),
+                        "files": file_list,
+                    }
+                )
+
+        (data_dir / "commits_index.json").write_bytes(dumps_json(commits_index, indent=False))
 
         # 3) repo_info.json
         repo_info = {"name": f"{owner}/{repo}", "full_name": f"{owner}/{repo}", "owner": owner, "platform": "gitee"}
-        with open(data_dir / "repo_info.json", "w", encoding="utf-8") as f:
-            json.dump(repo_info, f, indent=2, ensure_ascii=False)
+        (data_dir / "repo_info.json").write_bytes(dumps_json(repo_info))
 
         return True
     except Exception as e:
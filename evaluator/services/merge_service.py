@@ -1,10 +1,10 @@
 """Multi-evaluation merging service."""
 
-import requests
 from typing import Dict, Any, List
 from fastapi import HTTPException
 
 from evaluator.config import get_llm_api_key, DEFAULT_LLM_MODEL
+from evaluator.utils import get_http_session
 
 
 def merge_evaluations_logic(evaluations_data: List[Dict[str, Any]], model: str = DEFAULT_LLM_MODEL) -> Dict[str, Any]:
@@ -82,11 +82,11 @@ def merge_evaluations_logic(evaluations_data: List[Dict[str, Any]], model: str =
         print(f"[Merge] Using LLM to merge analysis summaries...")
 
         # Build prompt for LLM
-        summaries_text = ""
-        for author, weight, eval_data in zip(authors, weights, evaluations):
-            reasoning = eval_data.get("scores", {}).get("reasoning", "")
-            percentage = round((weight / total_weight) * 100, 1)
-            summaries_text += f"\n### {author} ({weight} commits, {percentage}% weight):\n{reasoning}\n"
+        summaries_text = "".join(
+            f"\n### {author} ({weight} commits, {round((weight / total_weight) * 100, 1)}% weight):\n"
+            f"{eval_data.get('scores', {}).get('reasoning', '')}\n"
+            for author, weight, eval_data in zip(authors, weights, evaluations)
+        )
 
         merge_prompt = f"""You are analyzing a software engineer who uses multiple names/identities in their commits. You have separate evaluations for each identity, and you need to create a unified, comprehensive analysis.
 
@@ -120,7 +120,7 @@ Write the unified analysis (3-5 paragraphs):"""
             merged_reasoning += summaries_text
         else:
             try:
-                llm_response = requests.post(
+                llm_response = get_http_session().post(
                     "https://openrouter.ai/api/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {api_key}",
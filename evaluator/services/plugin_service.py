@@ -1,17 +1,39 @@
 """Plugin discovery and management service."""
 
+import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, List, Optional, Tuple
 from fastapi import HTTPException
 
-from evaluator.plugin_registry import discover_plugins, get_default_plugin_id
+from evaluator.plugin_registry import PluginMeta, discover_plugins_shared, get_default_plugin_id
 
+PluginsSnapshot = Tuple[List[Tuple[PluginMeta, Path]], Optional[str]]
 
-def get_plugins_snapshot():
-    """Get current snapshot of available plugins and default plugin ID."""
-    plugins = discover_plugins()
-    default_id = get_default_plugin_id(plugins)
-    return plugins, default_id
+# (discovered list, snapshot built from it, its plugin ids); rebuilt only when discovery
+# returns a new list.
+_snapshot_cache: Optional[Tuple[List[Tuple[PluginMeta, Path]], PluginsSnapshot, FrozenSet[str]]] = None
+
+
+def _get_snapshot_entry() -> Tuple[List[Tuple[PluginMeta, Path]], PluginsSnapshot, FrozenSet[str]]:
+    global _snapshot_cache
+    plugins = discover_plugins_shared()
+    cached = _snapshot_cache
+    if cached is not None and cached[0] is plugins:
+        return cached
+    entry = (plugins, (plugins, get_default_plugin_id(plugins)), frozenset(m.plugin_id for m, _ in plugins))
+    _snapshot_cache = entry
+    return entry
+
+
+def get_plugins_snapshot() -> PluginsSnapshot:
+    """
+    Get current snapshot of available plugins and default plugin ID.
+
+    The snapshot is shared between calls while the plugins on disk are unchanged; treat the
+    plugin list as read-only.
+    """
+    return _get_snapshot_entry()[1]
 
 
 def resolve_plugin_id(requested: Optional[str]) -> str:
@@ -27,11 +49,11 @@ def resolve_plugin_id(requested: Optional[str]) -> str:
     Raises:
         HTTPException: If plugin not found or no plugins available
     """
-    plugins, default_id = get_plugins_snapshot()
+    _, (plugins, default_id), plugin_ids = _get_snapshot_entry()
     requested_id = (requested or "").strip()
     if requested_id:
         # Validate existence early for clearer errors.
-        if requested_id in {m.plugin_id for m, _ in plugins}:
+        if requested_id in plugin_ids:
             return requested_id
         raise HTTPException(
             status_code=400,
@@ -46,6 +68,26 @@ def resolve_plugin_id(requested: Optional[str]) -> str:
     raise HTTPException(status_code=500, detail="No plugins discovered (plugins/ directory missing?)")
 
 
+@lru_cache(maxsize=32)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    # mtime/size are part of the cache key so an edited file is re-hashed.
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def get_scan_module_digest(scan_path: Path) -> str:
+    """
+    Content digest of a plugin's scan module (prompt templates, rubric, scoring rules).
+
+    Returns an empty string if the file cannot be read.
+    """
+    try:
+        st = scan_path.stat()
+        return _file_digest(str(scan_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return ""
+
+
 def get_evaluation_cache_path(eval_dir: Path, author: str, plugin_id: str, default_id: Optional[str]) -> Path:
     """
     Construct cache file path for evaluation results.
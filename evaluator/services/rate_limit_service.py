@@ -0,0 +1,106 @@
+"""Client-side LLM rate limiting (evaluations and tokens per minute) with a token bucket."""
+
+import threading
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional
+
+from evaluator.config import get_llm_rate_limits
+
+# Fixed prompt overhead (rubric, instructions, output schema) added to every estimate
+_PROMPT_OVERHEAD_TOKENS = 2000
+
+
+class TokenBucket:
+    """
+    Dual token bucket: one bucket of evaluations (per minute) and one of LLM tokens (TPM).
+
+    One evaluation may issue several HTTP requests (one per chunk, plus retries), so the first
+    bucket paces whole evaluations, not provider requests; the token bucket covers them all.
+
+    Each bucket holds at most one minute's allowance and refills continuously, so short
+    bursts go through immediately and sustained load is paced to the configured rates.
+    A limit of None leaves that dimension unlimited.
+    """
+
+    def __init__(self, epm: Optional[float], tpm: Optional[float]):
+        self.epm = epm
+        self.tpm = tpm
+        self._lock = threading.Lock()
+        self._eval_tokens = float(epm or 0.0)
+        self._token_tokens = float(tpm or 0.0)
+        self._last_update = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.epm:
+            self._eval_tokens = min(self.epm, self._eval_tokens + elapsed * self.epm / 60.0)
+        if self.tpm:
+            self._token_tokens = min(self.tpm, self._token_tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """Block until one evaluation of ~estimated_tokens fits; returns the seconds waited."""
+        # A single evaluation larger than the whole bucket could never fit; cap it at a full bucket
+        tokens = min(float(estimated_tokens), self.tpm) if self.tpm else 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = 0.0
+                if self.epm and self._eval_tokens < 1.0:
+                    wait = (1.0 - self._eval_tokens) * 60.0 / self.epm
+                if self.tpm and self._token_tokens < tokens:
+                    wait = max(wait, (tokens - self._token_tokens) * 60.0 / self.tpm)
+                if wait <= 0.0:
+                    if self.epm:
+                        self._eval_tokens -= 1.0
+                    if self.tpm:
+                        self._token_tokens -= tokens
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_llm_rate_limiter() -> Optional[TokenBucket]:
+    """
+    Return the process-wide limiter, or None when no limit is configured.
+
+    Limits are read at call time; changing them (e.g. from the dashboard) starts a new bucket.
+    """
+    global _limiter
+    epm, tpm = get_llm_rate_limits()
+    if epm is None and tpm is None:
+        return None
+    limiter = _limiter
+    if limiter is not None and (limiter.epm, limiter.tpm) == (epm, tpm):
+        return limiter
+    with _limiter_lock:
+        if _limiter is None or (_limiter.epm, _limiter.tpm) != (epm, tpm):
+            _limiter = TokenBucket(epm, tpm)
+        return _limiter
+
+
+def estimate_evaluation_tokens(commits: Iterable[Dict[str, Any]], max_commits: int) -> int:
+    """Rough prompt size of evaluating up to max_commits commits (~4 characters per token)."""
+    chars = 0
+    for commit in islice(commits, max_commits):
+        for file_info in commit.get("files") or ():
+            if isinstance(file_info, dict):
+                chars += len(file_info.get("patch") or "")
+    return chars // 4 + _PROMPT_OVERHEAD_TOKENS
+
+
+def acquire_llm_capacity(commits: Iterable[Dict[str, Any]], max_commits: int, author: str) -> None:
+    """Wait for rate-limit capacity before an evaluation (no-op when no limit is configured)."""
+    limiter = get_llm_rate_limiter()
+    if limiter is None:
+        return
+    waited = limiter.acquire(estimate_evaluation_tokens(commits, max_commits))
+    if waited > 0:
+        print(f"[RateLimit] {author}: waited {waited:.1f}s for LLM capacity")
@@ -15,12 +15,24 @@ from evaluator.schemas import (
     EvaluationSchema,
     PeriodAccumulationState,
 )
-from evaluator.utils import load_commits_from_local, is_commit_by_author
+from evaluator.utils import load_commits_from_local, filter_commits_by_authors, loads_json, write_json_atomic
 from evaluator.services.evaluation_service import get_or_create_evaluator
 from evaluator.services.extraction_service import extract_github_data, extract_gitee_data
+from evaluator.services.budget_service import check_llm_budget, record_llm_usage
+from evaluator.services.rate_limit_service import acquire_llm_capacity
 from evaluator.plugin_registry import load_scan_module
 
 
+def _commit_date_str(commit: Dict[str, Any]) -> str:
+    """Author date of a commit (GitHub/Gitee shape), else its flat `date` field."""
+    commit_data = commit.get('commit')
+    if isinstance(commit_data, dict):
+        author_data = commit_data.get('author')
+        if isinstance(author_data, dict) and author_data.get('date'):
+            return author_data['date']
+    return commit.get('date', '') or ''
+
+
 def load_trajectory_cache(username: str) -> Optional[TrajectoryCache]:
     """
     Load trajectory cache from disk.
@@ -43,8 +55,8 @@ def load_trajectory_cache(username: str) -> Optional[TrajectoryCache]:
         return None
 
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(cache_path, 'rb') as f:
+            data = loads_json(f.read())
         return TrajectoryCache(**data)
     except Exception as e:
         print(f"[Trajectory] Failed to load cache for {username}: {e}")
@@ -59,20 +71,12 @@ def save_trajectory_cache(trajectory: TrajectoryCache) -> None:
         trajectory: TrajectoryCache to save
     """
     cache_path = get_trajectory_cache_path(trajectory.username)
-    tmp_path = cache_path.with_suffix('.json.tmp')
 
     try:
-        # Write to temp file first
-        with open(tmp_path, 'w', encoding='utf-8') as f:
-            json.dump(trajectory.model_dump(), f, indent=2, ensure_ascii=False)
-
-        # Atomic rename
-        tmp_path.rename(cache_path)
+        write_json_atomic(cache_path, trajectory.model_dump(mode="json"))
         print(f"[Trajectory] Saved cache for {trajectory.username} with {trajectory.total_checkpoints} checkpoints")
     except Exception as e:
         print(f"[Trajectory] Failed to save cache: {e}")
-        if tmp_path.exists():
-            tmp_path.unlink()
         raise
 
 
@@ -201,10 +205,7 @@ def get_new_commits_from_repos(
                 continue
 
             # Filter by author
-            author_commits = [
-                c for c in commits
-                if any(is_commit_by_author(c, alias) for alias in normalized_aliases)
-            ]
+            author_commits = filter_commits_by_authors(commits, normalized_aliases)
 
             print(f"[Trajectory] Loaded {len(commits)} total commits, {len(author_commits)} by {username} in {platform}/{owner}/{repo}")
 
@@ -273,12 +274,9 @@ def create_checkpoint_evaluation(
     if len(commits) < 10:
         raise ValueError(f"Need at least 10 commits for checkpoint, got {len(commits)}")
 
-    # Sort commits oldest to newest for analysis
-    sorted_commits = sorted(
-        commits,
-        key=lambda c: c.get('commit', {}).get('author', {}).get('date', '') or c.get('date', ''),
-        reverse=False
-    )
+    # Sort commits oldest to newest for analysis (groups from group_commits_by_period are
+    # already chronological, which the sort detects in a single linear pass)
+    sorted_commits = sorted(commits, key=_commit_date_str)
 
     # Extract commit range (oldest to newest)
     start_sha = sorted_commits[0].get('sha') or sorted_commits[0].get('hash')
@@ -307,6 +305,7 @@ def create_checkpoint_evaluation(
         print(f"[Trajectory] Passing previous checkpoint scores to evaluator: {list(previous_scores.keys())}")
 
     # Load scan module and create evaluator
+    check_llm_budget(sorted_commits, len(commits))
     meta, scan_mod, _ = load_scan_module(plugin_id)
 
     # Create evaluator with previous checkpoint scores support
@@ -322,6 +321,7 @@ def create_checkpoint_evaluation(
 
     # Evaluate
     print(f"[Trajectory] Evaluating checkpoint {checkpoint_id} with {len(commits)} commits (previous_checkpoint: {previous_checkpoint.checkpoint_id if previous_checkpoint else 'None'})")
+    acquire_llm_capacity(sorted_commits, len(commits), username)
     evaluation_result = evaluator.evaluate_engineer(
         commits=sorted_commits,
         username=username,
@@ -329,6 +329,7 @@ def create_checkpoint_evaluation(
         load_files=True,
         use_chunking=True
     )
+    record_llm_usage(evaluation_result, username)
 
     # Debug: Check type of evaluation_result
     print(f"[Trajectory] evaluation_result type: {type(evaluation_result)}")
@@ -492,18 +493,14 @@ def get_commits_by_date(
                 print(f"[Trajectory] Warning: commits_list.json not found in {data_dir}")
                 continue
 
-            with open(commits_list_path, 'r', encoding='utf-8') as f:
-                commits = json.load(f)
+            with open(commits_list_path, 'rb') as f:
+                commits = loads_json(f.read())
 
             if not commits:
                 continue
 
             # Filter by author and group by date
-            for commit in commits:
-                # Check if commit is by this author
-                if not any(is_commit_by_author(commit, alias) for alias in normalized_aliases):
-                    continue
-
+            for commit in filter_commits_by_authors(commits, normalized_aliases):
                 # Extract date from commit.author.date
                 commit_data = commit.get('commit', {})
                 author_data = commit_data.get('author', {})
@@ -573,10 +570,7 @@ def get_repo_start_date(
                 continue
 
             # Filter by author
-            author_commits = [
-                c for c in commits
-                if any(is_commit_by_author(c, alias) for alias in normalized_aliases)
-            ]
+            author_commits = filter_commits_by_authors(commits, normalized_aliases)
 
             if not author_commits:
                 continue
@@ -627,11 +621,7 @@ def group_commits_by_period(
         - periods_accumulated: Number of periods that contributed to the last checkpoint
     """
     # Sort commits oldest to newest (chronological order)
-    sorted_commits = sorted(
-        commits,
-        key=lambda c: c.get('commit', {}).get('author', {}).get('date', '') or c.get('date', ''),
-        reverse=False
-    )
+    sorted_commits = sorted(commits, key=_commit_date_str)
 
     # Initialize accumulation buffer with previously accumulated commits
     if accumulated_shas:
@@ -648,10 +638,7 @@ def group_commits_by_period(
     # Group commits by 2-week periods
     periods = {}  # {period_index: [commits]}
     for commit in sorted_commits:
-        # Get commit date
-        commit_data = commit.get('commit', {})
-        author_data = commit_data.get('author', {})
-        date_str = author_data.get('date', '') or commit.get('date', '')
+        date_str = _commit_date_str(commit)
 
         if not date_str:
             print(f"[Trajectory] Warning: Commit without date, skipping")
@@ -717,10 +704,7 @@ def build_period_metadata(
     # Find earliest and latest commit dates
     dates = []
     for commit in commits:
-        commit_data = commit.get('commit', {})
-        author_data = commit_data.get('author', {})
-        date_str = author_data.get('date', '') or commit.get('date', '')
-
+        date_str = _commit_date_str(commit)
         if date_str:
             try:
                 commit_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
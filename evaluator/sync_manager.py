@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from evaluator.utils import dumps_json, loads_json
+
 
 class SyncManager:
     """Manages incremental synchronization of repository commits"""
@@ -50,8 +52,8 @@ class SyncManager:
             }
 
         try:
-            with open(self.sync_state_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.sync_state_path, 'rb') as f:
+                return loads_json(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"[SyncManager] Error loading sync_state.json: {e}")
             return {
@@ -75,8 +77,7 @@ class SyncManager:
         # Atomic write using temporary file
         temp_path = self.sync_state_path.with_suffix('.tmp')
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
+            temp_path.write_bytes(dumps_json(state))
             temp_path.rename(self.sync_state_path)
             print(f"[SyncManager] Saved sync state to {self.sync_state_path}")
         except IOError as e:
@@ -180,8 +181,7 @@ class SyncManager:
 
                 # Save commit JSON
                 commit_file = self.commits_dir / f"{sha}.json"
-                with open(commit_file, 'w', encoding='utf-8') as f:
-                    json.dump(commit_data, f, indent=2, ensure_ascii=False)
+                commit_file.write_bytes(dumps_json(commit_data, indent=False))
 
                 # Save diff
                 diff_content = self._extract_diff(commit_data)
@@ -250,8 +250,8 @@ class SyncManager:
         existing_commits = []
         if self.commits_index_path.exists():
             try:
-                with open(self.commits_index_path, 'r', encoding='utf-8') as f:
-                    existing_commits = json.load(f)
+                with open(self.commits_index_path, 'rb') as f:
+                    existing_commits = loads_json(f.read())
             except (json.JSONDecodeError, IOError) as e:
                 print(f"[SyncManager] Error loading commits_index.json: {e}")
                 existing_commits = []
@@ -277,7 +277,7 @@ class SyncManager:
 
             entry = {
                 "sha": sha,
-                "message": message.split('\n')[0][:100],  # First line, max 100 chars
+                "message": message.partition('\n')[0][:100],  # First line, max 100 chars
                 "author": author_info.get("name", ""),
                 "date": author_info.get("date", ""),
                 "files_changed": len(commit.get("files", [])),
@@ -291,10 +291,9 @@ class SyncManager:
         # Prepend new commits (newest first)
         merged_commits = new_entries + existing_commits
 
-        # Save merged index
+        # Save merged index (machine-only; compact keeps it small and quick to reparse)
         try:
-            with open(self.commits_index_path, 'w', encoding='utf-8') as f:
-                json.dump(merged_commits, f, indent=2, ensure_ascii=False)
+            self.commits_index_path.write_bytes(dumps_json(merged_commits, indent=False))
             print(f"[SyncManager] Updated commits_index.json: {len(new_entries)} new commits")
         except IOError as e:
             print(f"[SyncManager] Error saving commits_index.json: {e}")
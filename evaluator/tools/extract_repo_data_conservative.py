@@ -91,9 +91,12 @@ def fetch_paginated(url_template, token=None, max_items=0):
     return results
 
 
-def save_json(path, obj):
+def save_json(path, obj, compact=False):
     with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+        if compact:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
 
 
 def main():
@@ -257,7 +260,7 @@ def main():
                 f.write(combined_diff)
 
         # Create minimal index entry
-        commit_msg = minimal_commit['message'].split('\n')[0][:100]  # First line, truncated
+        commit_msg = minimal_commit['message'].partition('\n')[0][:100]  # First line, truncated
 
         commits_index.append({
             'sha': sha,
@@ -271,7 +274,7 @@ def main():
 
         print(f'✓ ({len(files)} files, +{stats.get("additions", 0)}/-{stats.get("deletions", 0)})')
 
-    save_json(out_dir / 'commits_index.json', commits_index)
+    save_json(out_dir / 'commits_index.json', commits_index, compact=True)
     print(f'\n  ✓ Saved {len(commits_index)} commit diffs')
 
     # 4. Create statistics summary
@@ -293,7 +296,7 @@ def main():
             'avg_additions_per_commit': round(total_additions / len(commits_index)) if commits_index else 0,
             'avg_deletions_per_commit': round(total_deletions / len(commits_index)) if commits_index else 0
         },
-        'authors': sorted(list(authors_set)),
+        'authors': sorted(authors_set),
         'structure': {
             'commits/': f'{len(commits_index)} commits (JSON metadata + diffs only)',
             'commits_index.json': 'Minimal index of all commits',
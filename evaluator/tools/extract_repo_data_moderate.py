@@ -15,10 +15,12 @@ Does NOT include:
 
 import os
 import sys
+import heapq
 import json
 import argparse
 import urllib.request
 import urllib.error
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -26,6 +28,11 @@ def mkdir_p(path):
     os.makedirs(path, exist_ok=True)
 
 
+# Per-request socket timeout; the tool may run inside the API server, where a hung read
+# would otherwise hold a worker thread forever
+HTTP_TIMEOUT = 60
+
+
 def http_get(url, token=None):
     headers = {
         'Accept': 'application/vnd.github.v3+json',
@@ -36,7 +43,7 @@ def http_get(url, token=None):
 
     req = urllib.request.Request(url, headers=headers)
     try:
-        with urllib.request.urlopen(req) as resp:
+        with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
             data = resp.read().decode()
             return data, resp.getheaders()
     except urllib.error.HTTPError as e:
@@ -87,19 +94,22 @@ def fetch_paginated(url_template, token=None, max_items=0):
     return results
 
 
-def save_json(path, obj):
+def save_json(path, obj, compact=False):
     with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, indent=2, ensure_ascii=False)
+        if compact:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Extract moderate repository context (diffs + file context)')
     parser.add_argument('--repo-url', required=True, help='GitHub repository URL')
     parser.add_argument('--out', required=True, help='Output directory')
     parser.add_argument('--token', help='GitHub token (or set GITHUB_TOKEN env var)')
     parser.add_argument('--max-commits', type=int, default=500, help='Max commits (0=all, recommended: 300-500)')
     parser.add_argument('--platform', default='github', help='Platform (github, gitee, gitlab) - default: github')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Get token from args or environment
     token = args.token or os.environ.get('GITHUB_TOKEN')
@@ -213,7 +223,7 @@ def main():
 
         commits_index.append({
             'sha': sha,
-            'message': commit_msg.split('\n')[0][:100],  # First line, truncated
+            'message': commit_msg.partition('\n')[0][:100],  # First line, truncated
             'author': commit_obj.get('commit', {}).get('author', {}).get('name', ''),
             'date': commit_obj.get('commit', {}).get('author', {}).get('date', ''),
             'files_changed': len(file_list),
@@ -222,7 +232,7 @@ def main():
 
         print(f'✓ ({len(file_list)} files)')
 
-    save_json(out_dir / 'commits_index.json', commits_index)
+    save_json(out_dir / 'commits_index.json', commits_index, compact=True)
     print(f'\n  ✓ Saved {len(commits_index)} commit details')
 
     # 5. Fetch current file contents for files mentioned in diffs
@@ -231,7 +241,8 @@ def main():
     mkdir_p(files_dir)
 
     files_fetched = 0
-    for i, (filepath, mention_count) in enumerate(sorted(files_context.items(), key=lambda x: -x[1])[:100]):  # Top 100 most changed
+    top_files = heapq.nlargest(100, files_context.items(), key=itemgetter(1))  # Top 100 most changed
+    for i, (filepath, mention_count) in enumerate(top_files):
         print(f'  [{i+1}/{min(len(files_context), 100)}] {filepath}... ', end='', flush=True)
 
         # Fetch current file content
@@ -1,13 +1,37 @@
 """Utility modules for the evaluator package."""
 
 from evaluator.utils.repo_parser import parse_repo_url, parse_github_url
-from evaluator.utils.commit_utils import get_author_from_commit, is_commit_by_author
-from evaluator.utils.data_loader import load_commits_from_local
+from evaluator.utils.commit_utils import (
+    get_author_from_commit,
+    is_commit_by_author,
+    filter_commits_by_authors,
+    build_author_index,
+    select_commits_by_authors,
+)
+from evaluator.utils.data_loader import (
+    load_commits_from_local,
+    iter_commits_from_local,
+    iter_json_files,
+    iter_json_paths,
+)
+from evaluator.utils.json_io import loads_json, dumps_json, write_json_atomic, FastJSONResponse
+from evaluator.utils.http_client import get_http_session
 
 __all__ = [
     "parse_repo_url",
     "parse_github_url",
     "get_author_from_commit",
     "is_commit_by_author",
+    "filter_commits_by_authors",
+    "build_author_index",
+    "select_commits_by_authors",
     "load_commits_from_local",
+    "iter_commits_from_local",
+    "iter_json_files",
+    "iter_json_paths",
+    "loads_json",
+    "dumps_json",
+    "write_json_atomic",
+    "FastJSONResponse",
+    "get_http_session",
 ]
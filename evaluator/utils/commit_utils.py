@@ -1,6 +1,23 @@
 """Commit data utility functions."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
+
+
+def _commit_person_name(commit_data: Dict[str, Any], role: str) -> Optional[str]:
+    """commit_data["commit"][role]["name"] without allocating .get({}) defaults on every miss."""
+    try:
+        return commit_data["commit"][role]["name"]
+    except (KeyError, TypeError):
+        return None
+
+
+# Fallback lookups for get_author_from_commit, tried in order; the first truthy name wins
+_AUTHOR_NAME_PATHS = (
+    ("commit", "author", "name"),  # GitHub/Gitee API format
+    ("commit", "committer", "name"),  # some APIs populate committer name but not author name
+    ("author", "name"),  # some providers use nested dicts for author/committer
+    ("committer", "name"),
+)
 
 
 def get_author_from_commit(commit_data: Dict[str, Any]) -> Optional[str]:
@@ -10,34 +27,67 @@ def get_author_from_commit(commit_data: Dict[str, Any]) -> Optional[str]:
     2. Custom extraction format: commit_data["author"]
     """
     # Try custom extraction format first (more common in local data)
-    if "author" in commit_data and isinstance(commit_data["author"], str):
-        return commit_data["author"]
-
-    # Try GitHub/Gitee API format
-    if "commit" in commit_data:
-        author = commit_data.get("commit", {}).get("author", {}).get("name")
-        if author:
-            return author
-
-        # Some APIs may populate committer name but not author name
-        committer = commit_data.get("commit", {}).get("committer", {}).get("name")
-        if committer:
-            return committer
-
-    # Some providers use nested dicts for author/committer
-    if "author" in commit_data and isinstance(commit_data["author"], dict):
-        name = commit_data["author"].get("name")
-        if name:
-            return name
-
-    if "committer" in commit_data and isinstance(commit_data["committer"], dict):
-        name = commit_data["committer"].get("name")
-        if name:
-            return name
+    author = commit_data.get("author")
+    if isinstance(author, str):
+        return author
+
+    for path in _AUTHOR_NAME_PATHS:
+        value = commit_data
+        try:
+            for key in path:
+                value = value[key]
+        except (KeyError, TypeError):
+            continue
+        if value:
+            return value
 
     return None
 
 
+def _matching_author_name(commit: Dict[str, Any]) -> Optional[str]:
+    """Lowercased author name using the same lookup rules as is_commit_by_author (None if absent)."""
+    if "author" in commit and isinstance(commit["author"], str):
+        return commit["author"].lower()
+    author = _commit_person_name(commit, "author")
+    if author:
+        return author.lower()
+    return None
+
+
+def filter_commits_by_authors(commits: Iterable[Dict[str, Any]], usernames: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Return commits by any of the given authors, preserving order.
+
+    Equivalent to ``any(is_commit_by_author(c, u) for u in usernames)`` per commit, but the
+    author name is extracted once per commit and matched against a set.
+    """
+    wanted = {u.lower() for u in usernames}
+    return [c for c in commits if _matching_author_name(c) in wanted]
+
+
+def build_author_index(commits: Iterable[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """
+    Map each lowercased author name to its commits' positions, in one pass.
+
+    Uses the same lookup rules as is_commit_by_author. Lets several identities be picked out
+    of one commit list with select_commits_by_authors instead of rescanning it per identity.
+    """
+    index: Dict[str, List[int]] = {}
+    for i, commit in enumerate(commits):
+        name = _matching_author_name(commit)
+        if name is not None:
+            index.setdefault(name, []).append(i)
+    return index
+
+
+def select_commits_by_authors(
+    commits: List[Dict[str, Any]], index: Dict[str, List[int]], usernames: Iterable[str]
+) -> List[Dict[str, Any]]:
+    """Like filter_commits_by_authors, but looked up in a build_author_index(commits) result."""
+    positions = {i for u in usernames for i in index.get(u.lower(), ())}
+    return [commits[i] for i in sorted(positions)]
+
+
 def is_commit_by_author(commit: Dict[str, Any], username: str) -> bool:
     """Check if commit is by the specified author"""
     # Try custom extraction format first
@@ -45,9 +95,8 @@ def is_commit_by_author(commit: Dict[str, Any], username: str) -> bool:
         return commit["author"].lower() == username.lower()
 
     # Try GitHub API format
-    if "commit" in commit:
-        author = commit.get("commit", {}).get("author", {}).get("name", "")
-        if author:
-            return author.lower() == username.lower()
+    author = _commit_person_name(commit, "author")
+    if author:
+        return author.lower() == username.lower()
 
     return False
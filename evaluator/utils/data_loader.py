@@ -1,8 +1,163 @@
 """Data loading utilities for local commit data."""
 
-import json
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from evaluator.utils.json_io import loads_json
+
+try:  # optional streaming parser for very large commits_index.json files
+    import ijson
+except ImportError:
+    ijson = None
+
+# Commit files are read on a small thread pool, keeping this many reads in flight.
+_READ_WORKERS = 16
+_READ_AHEAD = 64
+
+# Assembled commit list persisted next to the raw data, so a warm start is one read
+_COMMITS_BUNDLE_NAME = ".commits_bundle.pickle"
+
+
+def _bundle_key(commits_index_path: Path, commits_dir: Path) -> Optional[Tuple[int, ...]]:
+    """Fingerprint of the inputs: index rewrite or any commit file added/removed changes it."""
+    try:
+        index_stat = commits_index_path.stat()
+        dir_stat = commits_dir.stat()
+    except OSError:
+        return None
+    return (index_stat.st_mtime_ns, index_stat.st_size, dir_stat.st_mtime_ns)
+
+
+def _read_commits_bundle(path: Path, key: Tuple[int, ...]) -> Optional[List[Dict[str, Any]]]:
+    try:
+        with open(path, 'rb') as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Warning] Ignoring unreadable commits bundle {path}: {e}")
+        return None
+    if not isinstance(bundle, dict) or bundle.get("key") != key:
+        return None
+    return bundle.get("commits")
+
+
+def _write_commits_bundle(path: Path, key: Tuple[int, ...], commits: List[Dict[str, Any]]) -> None:
+    # Unique per writer: two cold loads of the same repo may write the bundle at once
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"key": key, "commits": commits}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+    except Exception as e:
+        print(f"[Warning] Failed to write commits bundle {path}: {e}")
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _iter_commits_index(commits_index_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield index entries; streamed with ijson when installed, else parsed in one go."""
+    with open(commits_index_path, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item")
+        else:
+            yield from loads_json(f.read())
+
+
+def iter_json_paths(directory: Path) -> Iterator[str]:
+    """
+    Yield the paths (as str) of the *.json files directly under directory (unordered; nothing
+    if it is missing).
+
+    One os.scandir pass with a suffix check; cheaper than Path.glob, which runs every entry
+    name through a pattern match and builds a Path per entry.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+    except FileNotFoundError:
+        return
+
+
+def _read_json_file(path: Union[str, Path]) -> Any:
+    # Unbuffered: readall() sizes one read from fstat, no BufferedReader in between
+    with open(path, 'rb', buffering=0) as f:
+        return loads_json(f.readall())
+
+
+def iter_json_files(paths: Iterable[Union[str, Path]]) -> Iterator[Tuple[Union[str, Path], Any]]:
+    """
+    Yield (path, parsed JSON) in input order, reading on a thread pool.
+
+    File I/O overlaps on a bounded read-ahead window, so memory stays O(window) however many
+    paths are given. Unreadable or malformed files are reported and skipped.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        for path in paths:
+            pending.append((path, pool.submit(_read_json_file, path)))
+            if len(pending) < _READ_AHEAD:
+                continue
+            path_done, future = pending.popleft()
+            try:
+                yield path_done, future.result()
+            except Exception as e:
+                print(f"[Warning] Failed to load {os.path.basename(path_done)}: {e}")
+        while pending:
+            path_done, future = pending.popleft()
+            try:
+                yield path_done, future.result()
+            except Exception as e:
+                print(f"[Warning] Failed to load {os.path.basename(path_done)}: {e}")
+
+
+def _read_commit_files(commits_dir: Path, shas: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Read commit files in index order."""
+    for _, commit in iter_json_files(commits_dir / f"{sha}.json" for sha in shas):
+        yield commit
+
+
+def iter_commits_from_local(data_dir: Path, limit: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield commits from local extracted data one at a time, in index order.
+
+    Unlike load_commits_from_local this never materializes the whole commit list, so callers
+    that only keep a filtered subset (e.g. one author's commits) stay O(subset) in memory.
+    """
+    commits_index_path = data_dir / "commits_index.json"
+    if not commits_index_path.exists():
+        print(f"[Warning] Commits index not found: {commits_index_path}")
+        return
+
+    commits_dir = data_dir / "commits"
+
+    # List the commits directory once instead of stat()-ing every expected file
+    try:
+        with os.scandir(commits_dir) as it:
+            available = {entry.name for entry in it if entry.name.endswith(".json")}
+    except OSError:
+        available = set()
+
+    # Apply limit if specified
+    commits_to_load = islice(_iter_commits_index(commits_index_path), limit)
+
+    def _shas() -> Iterator[str]:
+        for commit_info in commits_to_load:
+            commit_sha = commit_info.get("hash") or commit_info.get("sha")
+            if commit_sha and f"{commit_sha}.json" in available:
+                yield commit_sha
+
+    yield from _read_commit_files(commits_dir, _shas())
 
 
 def load_commits_from_local(data_dir: Path, limit: int = None) -> List[Dict[str, Any]]:
@@ -22,33 +177,22 @@ def load_commits_from_local(data_dir: Path, limit: int = None) -> List[Dict[str,
         print(f"[Warning] Commits index not found: {commits_index_path}")
         return []
 
-    # Load commits index
-    with open(commits_index_path, 'r', encoding='utf-8') as f:
-        commits_index = json.load(f)
-
-    # Load detailed commit data
-    commits = []
     commits_dir = data_dir / "commits"
+    bundle_path = data_dir / _COMMITS_BUNDLE_NAME
+    bundle_key = _bundle_key(commits_index_path, commits_dir)
+    if bundle_key is not None:
+        cached = _read_commits_bundle(bundle_path, bundle_key)
+        if cached is not None:
+            commits = cached if limit is None else cached[:limit]
+            print(f"[Info] Loaded {len(commits)} commit details (bundle)")
+            return commits
 
-    # Apply limit if specified
-    commits_to_load = commits_index if limit is None else commits_index[:limit]
-
-    for commit_info in commits_to_load:
-        commit_sha = commit_info.get("hash") or commit_info.get("sha")
-
-        if not commit_sha:
-            continue
-
-        # Try to load commit JSON
-        commit_json_path = commits_dir / f"{commit_sha}.json"
+    # Load detailed commit data
+    commits = list(iter_commits_from_local(data_dir, limit))
 
-        if commit_json_path.exists():
-            try:
-                with open(commit_json_path, 'r', encoding='utf-8') as f:
-                    commit_data = json.load(f)
-                    commits.append(commit_data)
-            except Exception as e:
-                print(f"[Warning] Failed to load {commit_sha}: {e}")
+    # Only a full load is a complete snapshot worth persisting
+    if limit is None and bundle_key is not None:
+        _write_commits_bundle(bundle_path, bundle_key, commits)
 
     print(f"[Info] Loaded {len(commits)} commit details")
     return commits
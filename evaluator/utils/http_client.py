@@ -0,0 +1,46 @@
+"""Shared HTTP session for outbound API calls (GitHub, Gitee, OpenRouter)."""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Sized for the server's concurrent evaluations plus parallel Gitee detail fetches
+_POOL_MAXSIZE = 32
+
+
+def _make_retry() -> Retry:
+    # Only idempotent GETs are retried: a replayed LLM POST would be billed twice
+    return Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide pooled session.
+
+    Reusing one session keeps TCP/TLS connections alive between calls to the same host
+    instead of paying a fresh handshake per request. Sessions are safe to share across the
+    threads the server uses for concurrent evaluations. Transient connection failures and
+    502/503/504 responses on GET are retried with a short backoff.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=_POOL_MAXSIZE, max_retries=_make_retry())
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
@@ -0,0 +1,62 @@
+"""JSON (de)serialization helpers for on-disk caches."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:  # optional fast JSON codec
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response class for routes returning large JSON payloads (ORJSONResponse needs orjson).
+FastJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def loads_json(raw: bytes) -> Any:
+    """Decode JSON from bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Encode JSON as UTF-8 bytes (orjson when available).
+
+    Indented by default; pass indent=False for machine-only files (e.g. per-commit caches),
+    which are smaller and faster to encode compact.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_json_atomic(path: Path, data: Any, indent: bool = True) -> None:
+    """
+    Write JSON to path atomically (temp file + os.replace).
+
+    Readers never see a half-written file; on failure the temp file is removed and the
+    exception propagates. The temp file name is unique, so concurrent writers of the same
+    path cannot clobber each other's partial output (the last replace wins). indent is passed
+    to dumps_json.
+    """
+    buf = dumps_json(data, indent=indent)
+    # One temp file per writer thread (the same path may be saved by overlapping requests)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(buf)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
@@ -3,6 +3,17 @@
 import re
 from typing import Optional, Dict, Tuple
 
+_GITHUB_URL_PATTERNS = tuple(re.compile(p) for p in (
+    r'^https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
+))
+
+_GITEE_URL_PATTERNS = tuple(re.compile(p) for p in (
+    r'^https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+    r'^gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
+))
+
 
 def parse_github_url(url: str) -> Optional[Dict[str, str]]:
     """
@@ -16,14 +27,8 @@ def parse_github_url(url: str) -> Optional[Dict[str, str]]:
     url = url.strip()
 
     # Try different patterns
-    patterns = [
-        r'^https?://(?:www\.)?github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^github\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^git@github\.com:([^/]+)/([^/\s]+?)(?:\.git)?$',
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, url)
+    for pattern in _GITHUB_URL_PATTERNS:
+        match = pattern.match(url)
         if match:
             owner, repo = match.groups()
             # Remove .git suffix if present
@@ -49,12 +54,8 @@ def parse_repo_url(url: str) -> Optional[Tuple[str, str, str]]:
     if parsed:
         return ("github", parsed["owner"], parsed["repo"])
 
-    patterns = [
-        r'^https?://(?:www\.)?gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-        r'^gitee\.com/([^/]+)/([^/\s]+?)(?:\.git)?/?$',
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, url)
+    for pattern in _GITEE_URL_PATTERNS:
+        match = pattern.match(url)
         if match:
             owner, repo = match.groups()
             repo = repo.replace('.git', '')
@@ -227,12 +227,11 @@ def _parse_env_file(path: Path) -> dict:
     try:
         for raw in path.read_text(encoding="utf-8").splitlines():
             line = raw.strip()
-            if not line or line.startswith("#"):
+            if not line or line[0] == "#":
                 continue
-            if "=" not in line:
-                continue
-            k, v = line.split("=", 1)
-            env[k.strip()] = v.strip()
+            k, sep, v = line.partition("=")
+            if sep:
+                env[k.rstrip()] = v.lstrip()
     except FileNotFoundError:
         return {}
     return env
@@ -272,16 +271,28 @@ def _write_env_file(path: Path, env: dict) -> None:
         if k in env and env[k] is not None and str(env[k]).strip() != "":
             lines.append(f"{k}={env[k]}")
     # Write remaining keys not in the predefined order (rare)
-    for k in sorted(env.keys()):
-        if k in order:
-            continue
+    order_set = set(order)
+    for k in sorted(k for k in env if k not in order_set):
         v = env[k]
         if v is None or str(v).strip() == "":
             continue
         lines.append(f"{k}={v}")
 
     lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+    # Replace atomically so an interrupted `oscanner init` cannot truncate existing keys.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def _prompt(text: str, default: Optional[str] = None) -> str:
@@ -16,14 +16,154 @@ Standard reference:
 - engineer_level.md (2026 AI-Native Engineer Practical Competency Standard)
 """
 
+import heapq
+import io
 import json
+import logging
 import os
+import random
+import threading
+import time
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, FrozenSet, List, Optional, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
+try:  # optional C extension (pyahocorasick) for the keyword fallback
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:  # optional fast JSON codec (request bodies, repo_structure.json)
+    import orjson
+except ImportError:
+    orjson = None
+try:  # optional real tokenizer for prompt budgeting (chars/4 heuristic otherwise)
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+
+# Cap on related files loaded per evaluation and emitted into the prompt.
+_MAX_FILES_IN_PROMPT: Final[int] = 25
+# Threads used to read those files from data_dir/files.
+_FILE_READ_WORKERS: Final[int] = 8
+# Share of max_input_tokens the file dump may use, so commit diffs are not truncated away.
+_FILE_CONTEXT_SHARE: Final[float] = 0.4
+# Per-item caps in tokens (the old char caps were 4000/12000 chars, i.e. ~1000/3000 tokens).
+_PATCH_TOKEN_LIMIT: Final[int] = 1000
+_FILE_TOKEN_LIMIT: Final[int] = 3000
+# Upper bound on characters per token (~4 on average, 8 leaves room for whitespace runs).
+# Text past limit * this would be cut by token truncation anyway, so it is never read/built.
+_MAX_CHARS_PER_TOKEN: Final[int] = 8
+_FILE_READ_CHARS: Final[int] = _FILE_TOKEN_LIMIT * _MAX_CHARS_PER_TOKEN
+# Transient LLM API failures are retried (per model) with exponential backoff + full jitter.
+_LLM_MAX_ATTEMPTS: Final[int] = 4
+_LLM_BACKOFF_BASE_S: Final[float] = 1.0
+_LLM_BACKOFF_MAX_S: Final[float] = 30.0
+_RETRYABLE_STATUS: Final[FrozenSet[int]] = frozenset({408, 409, 429, 500, 502, 503, 504})
+# Below either threshold a contributor is "low-signal" and may be scored by the light model.
+_LIGHT_MODEL_MAX_COMMITS: Final[int] = 3
+_LIGHT_MODEL_MAX_CHURN: Final[int] = 50
+
+# Shared read-only default for missing commit sub-dicts (never mutate).
+_EMPTY_DICT: Final[Dict[str, Any]] = {}
+
+# Score keys emitted by this plugin; `self.dimensions` only maps them to display names.
+_DIMENSION_KEYS: Final[Tuple[str, ...]] = (
+    "spec_quality",
+    "cloud_architecture",
+    "ai_engineering",
+    "mastery_professionalism",
+)
+
+# Heuristic keywords tuned toward engineer_level.md signals
+_FALLBACK_KEYWORDS: Final[Dict[str, Tuple[str, ...]]] = {
+    "ai_fullstack": ("refactor", "test", "lint", "type", "validation", "error", "edge", "bugfix"),
+    "ai_architecture": ("architecture", "adr", "design", "interface", "module", "boundary", "migration", "trade-off"),
+    "cloud_native": ("docker", "compose", "kubernetes", "deploy", "ci", "cd", "terraform", "devcontainer"),
+    "open_source": ("pr", "review", "issue", "docs", "changelog", "release", "discussion", "community"),
+    "intelligent_dev": ("automation", "script", "tool", "agent", "prompt", "eval", "dataset", "trace"),
+    "leadership": ("security", "performance", "optimize", "reliability", "incident", "standard", "best practice"),
+}
+_ALL_FALLBACK_KEYWORDS: Final[FrozenSet[str]] = frozenset(kw for kws in _FALLBACK_KEYWORDS.values() for kw in kws)
+
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in _ALL_FALLBACK_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _find_fallback_keywords(text: str) -> FrozenSet[str]:
+    """Return every fallback keyword that occurs as a substring of (lowercased) text."""
+    if _KEYWORD_AUTOMATON is not None:
+        # Single linear pass over the context, regardless of keyword count.
+        return frozenset(kw for _, kw in _KEYWORD_AUTOMATON.iter(text))
+    return frozenset(kw for kw in _ALL_FALLBACK_KEYWORDS if kw in text)
+
+
+def _supports_prompt_cache(model: str) -> bool:
+    """Anthropic models only cache prompt prefixes marked with explicit cache_control breakpoints."""
+    m = (model or "").lower()
+    return m.startswith("anthropic/") or "claude" in m
+
+
+_ENCODING: Any = None
+_ENCODING_LOADED = False
+_ENCODING_LOCK = threading.Lock()
+
+
+def _get_encoding() -> Any:
+    """cl100k_base is close enough to Claude/Qwen tokenizers for budgeting; loaded once."""
+    global _ENCODING, _ENCODING_LOADED
+    if not _ENCODING_LOADED:
+        with _ENCODING_LOCK:
+            if not _ENCODING_LOADED:
+                if tiktoken is not None:
+                    try:
+                        _ENCODING = tiktoken.get_encoding("cl100k_base")
+                    except Exception as e:  # e.g. BPE file not cached and no network
+                        print(f"[WARNING] tiktoken unavailable, using chars/4 estimate: {e}")
+                _ENCODING_LOADED = True
+    return _ENCODING
+
+
+def _count_tokens(text: str) -> int:
+    enc = _get_encoding()
+    if enc is None:
+        return max(1, len(text) // 4)
+    return max(1, len(enc.encode(text, disallowed_special=())))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    # A token is at least one character, so short strings never need encoding.
+    if len(text) <= max_tokens:
+        return text
+    enc = _get_encoding()
+    if enc is None:
+        return text[: max_tokens * 4]
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 _RUBRIC_SUMMARY = """
 You are evaluating an engineer in the Vibe Coding era. Distinguish "AI搬运工" vs "系统构建者".
@@ -97,6 +237,7 @@ class CommitEvaluatorModerate:
         api_base_url: Optional[str] = None,
         chat_completions_url: Optional[str] = None,
         fallback_models: Optional[List[str]] = None,
+        light_model: Optional[str] = None,
         rubric_text: Optional[str] = None,
         language: str = "en-US",
         parallel_chunking: bool = False,
@@ -125,6 +266,8 @@ class CommitEvaluatorModerate:
         self.mode = mode
         self.model = model or os.getenv("OSCANNER_LLM_MODEL") or "anthropic/claude-sonnet-4.5"
         self.fallback_models = fallback_models
+        # Optional cheaper model for low-signal contributors (unset = always use self.model).
+        self.light_model = light_model or os.getenv("OSCANNER_LLM_LIGHT_MODEL") or None
         self.rubric_text = (rubric_text or "").strip()
         self.language = language
         self.parallel_chunking = parallel_chunking
@@ -146,6 +289,13 @@ class CommitEvaluatorModerate:
 
         self._file_cache: Dict[str, str] = {}
         self._repo_structure: Optional[Dict[str, Any]] = None
+        self._repo_block_memo: Optional[Tuple[Dict[str, Any], str, int]] = None
+        # Keep-alive connection pool shared by all LLM calls of this evaluator.
+        self._session = requests.Session()
+        # Token/cost totals of the current evaluate_engineer call (chunks may run in parallel).
+        self._usage_lock = threading.Lock()
+        self._llm_usage: Dict[str, Any] = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
+        self._commit_stats_memo: Optional[Tuple[List[Dict[str, Any]], Tuple[Dict[str, int], int, int]]] = None
 
     def evaluate_engineer(
         self,
@@ -159,23 +309,40 @@ class CommitEvaluatorModerate:
         if not commits:
             return self._get_empty_evaluation(username)
         analyzed_commits = commits if max_commits is None else commits[: int(max_commits)]
-        author_commits = [c for c in analyzed_commits if self._is_commit_by_author(c, username)]
+        # Resolve the alias set once instead of re-splitting the username per commit.
+        aliases = frozenset(alias.strip().lower() for alias in username.split(','))
+        author_commits = [c for c in analyzed_commits if self._is_commit_by_author(c, aliases)]
         if not author_commits:
             return self._get_empty_evaluation(username)
+        with self._usage_lock:
+            self._llm_usage = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
         if use_chunking and len(author_commits) > 20:
-            return self._evaluate_engineer_chunked(author_commits, username, load_files=load_files)
-        return self._evaluate_engineer_standard(author_commits, username, load_files=load_files)
-
-    def _is_commit_by_author(self, commit: Dict[str, Any], username: str) -> bool:
-        # Handle comma-separated usernames as multiple aliases
-        aliases = [alias.strip().lower() for alias in username.split(',')]
-
+            result = self._evaluate_engineer_chunked(author_commits, username, load_files=load_files)
+        else:
+            result = self._evaluate_engineer_standard(author_commits, username, load_files=load_files)
+        # Reported to the host for spend tracking; it removes the key before caching results.
+        with self._usage_lock:
+            result["llm_usage"] = dict(self._llm_usage)
+        return result
+
+    def _route_model(self, commits: List[Dict[str, Any]]) -> str:
+        """Pick the light model for contributors with very few commits or tiny total churn."""
+        if not self.light_model:
+            return self.model
+        if len(commits) < _LIGHT_MODEL_MAX_COMMITS:
+            return self.light_model
+        # Same memoized pass the file ranking and commit summary use; no extra walk.
+        _, additions, deletions = self._commit_stats(commits)
+        return self.model if additions + deletions >= _LIGHT_MODEL_MAX_CHURN else self.light_model
+
+    def _is_commit_by_author(self, commit: Dict[str, Any], aliases: FrozenSet[str]) -> bool:
         if "author" in commit and isinstance(commit["author"], str):
             return commit["author"].lower() in aliases
-        if "commit" in commit:
-            author = commit.get("commit", {}).get("author", {}).get("name", "")
-            return bool(author) and author.lower() in aliases
-        return False
+        try:
+            author = commit["commit"]["author"]["name"]
+        except (KeyError, TypeError):
+            return False
+        return bool(author) and author.lower() in aliases
 
     def _evaluate_engineer_standard(self, commits: List[Dict[str, Any]], username: str, *, load_files: bool) -> Dict[str, Any]:
         file_contents: Dict[str, str] = {}
@@ -183,8 +350,10 @@ class CommitEvaluatorModerate:
         if self.mode == "moderate" and load_files and self.data_dir:
             file_contents = self._load_relevant_files(commits)
             repo_structure = self._load_repo_structure()
-        context = self._build_commit_context(commits, username, file_contents=file_contents, repo_structure=repo_structure)
-        scores = self._evaluate_with_llm(context, username)
+        context = self._build_commit_context(commits, username, file_contents=file_contents)
+        scores = self._evaluate_with_llm(
+            context, username, repo_structure=repo_structure, model=self._route_model(commits)
+        )
         return {
             "username": username,
             "total_commits_analyzed": len(commits),
@@ -211,22 +380,24 @@ class CommitEvaluatorModerate:
         if self.mode == "moderate" and load_files and self.data_dir:
             repo_structure = self._load_repo_structure()
         accumulated = None
-        all_files: Dict[str, str] = {}
+        # Only the names are needed (for files_loaded); contents stay in self._file_cache.
+        loaded_files: Set[str] = set()
         for idx, chunk in enumerate(chunks, 1):
             chunk_files: Dict[str, str] = {}
             if self.mode == "moderate" and load_files and self.data_dir:
                 chunk_files = self._load_relevant_files(chunk)
-                all_files.update(chunk_files)
+                loaded_files.update(chunk_files)
             context = self._build_chunked_context(
                 chunk,
                 username,
                 chunk_idx=idx,
                 total_chunks=len(chunks),
                 file_contents=chunk_files,
-                repo_structure=repo_structure if idx == 1 else None,
                 previous_evaluation=accumulated,
             )
-            chunk_scores = self._evaluate_with_llm(context, username, chunk_idx=idx)
+            chunk_scores = self._evaluate_with_llm(
+                context, username, chunk_idx=idx, repo_structure=repo_structure if idx == 1 else None
+            )
             if accumulated is None:
                 accumulated = chunk_scores
             else:
@@ -237,7 +408,7 @@ class CommitEvaluatorModerate:
         return {
             "username": username,
             "total_commits_analyzed": len(all_commits),
-            "files_loaded": len(all_files),
+            "files_loaded": len(loaded_files),
             "mode": self.mode,
             "scores": accumulated or self._fallback_evaluation(""),
             "commits_summary": self._summarize_commits(all_commits),
@@ -252,7 +423,8 @@ class CommitEvaluatorModerate:
         if self.mode == "moderate" and load_files and self.data_dir:
             repo_structure = self._load_repo_structure()
 
-        all_files: Dict[str, str] = {}
+        # Only the names are needed (for files_loaded); contents stay in self._file_cache.
+        loaded_files: Set[str] = set()
         chunk_results: List[Dict[str, Any]] = []
 
         def evaluate_single_chunk(idx: int, chunk: List[Dict[str, Any]]) -> tuple[int, Dict[str, Any], Dict[str, str]]:
@@ -266,13 +438,14 @@ class CommitEvaluatorModerate:
                 chunk,
                 username,
                 file_contents=chunk_files,
-                repo_structure=repo_structure if idx == 1 else None,
             )
 
             # Add chunk metadata to context
             context_with_meta = f"CHUNK {idx}/{len(chunks)}\n\n{context}"
 
-            chunk_scores = self._evaluate_with_llm(context_with_meta, username, chunk_idx=idx)
+            chunk_scores = self._evaluate_with_llm(
+                context_with_meta, username, chunk_idx=idx, repo_structure=repo_structure if idx == 1 else None
+            )
             print(f"[Parallel] Chunk {idx}/{len(chunks)} completed")
             return idx, chunk_scores, chunk_files
 
@@ -287,7 +460,7 @@ class CommitEvaluatorModerate:
                 try:
                     idx, scores, files = future.result()
                     chunk_results.append({"chunk_idx": idx, "scores": scores})
-                    all_files.update(files)
+                    loaded_files.update(files)
                 except Exception as e:
                     print(f"[Parallel] Chunk evaluation failed: {e}")
                     raise
@@ -304,7 +477,7 @@ class CommitEvaluatorModerate:
         return {
             "username": username,
             "total_commits_analyzed": len(all_commits),
-            "files_loaded": len(all_files),
+            "files_loaded": len(loaded_files),
             "mode": self.mode,
             "scores": merged_scores,
             "commits_summary": self._summarize_commits(all_commits),
@@ -362,12 +535,12 @@ Return the same JSON format as before."""
     def _simple_average_merge(self, chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Fallback: simple averaging of all chunk scores"""
         if not chunk_results:
-            return {k: 0 for k in self.dimensions.keys()}
+            return {k: 0 for k in _DIMENSION_KEYS}
 
         merged: Dict[str, Any] = {}
 
         # Average numeric scores
-        for k in self.dimensions.keys():
+        for k in _DIMENSION_KEYS:
             scores = [r["scores"].get(k, 0) for r in chunk_results]
             merged[k] = int(sum(scores) / len(scores))
 
@@ -386,29 +559,43 @@ Return the same JSON format as before."""
         username: str,
         *,
         file_contents: Dict[str, str],
-        repo_structure: Optional[Dict[str, Any]],
     ) -> str:
-        parts: List[str] = [f"User: {username}", f"Commits: {len(commits)}", ""]
-        if repo_structure:
-            parts.append("REPO STRUCTURE (truncated):")
-            parts.append(json.dumps(repo_structure, ensure_ascii=False)[:8000])
-            parts.append("")
+        # Contributor-specific only; the shared repo structure lives in the cached prompt prefix.
+        # Written straight into one buffer; each piece carries its own leading newline.
+        buf = io.StringIO()
+        buf.write(f"User: {username}\nCommits: {len(commits)}\n")
         if file_contents:
-            parts.append("RELEVANT FILE CONTENTS:")
-            for p, content in list(file_contents.items())[:25]:
-                parts.append(f"\n--- FILE: {p} ---\n{content[:12000]}")
-            parts.append("")
-        parts.append("COMMITS:")
+            buf.write("\nRELEVANT FILE CONTENTS:")
+            # file_contents is in priority order; fill the budget greedily, skipping files that
+            # no longer fit so smaller high-priority files still make it in.
+            budget = int(self.max_input_tokens * _FILE_CONTEXT_SHARE)
+            for p, content in islice(file_contents.items(), _MAX_FILES_IN_PROMPT):
+                block = f"\n--- FILE: {p} ---\n{_truncate_to_tokens(content, _FILE_TOKEN_LIMIT)}"
+                cost = self._estimate_tokens(block)
+                if cost > budget:
+                    continue
+                budget -= cost
+                buf.write("\n")
+                buf.write(block)
+            buf.write("\n")
+        buf.write("\nCOMMITS:")
+        # The prompt builder truncates to max_input_tokens; stop once that is certainly exceeded.
+        char_cap = self.max_input_tokens * _MAX_CHARS_PER_TOKEN
         for c in commits[:50]:
+            if buf.tell() > char_cap:
+                break
             sha = c.get("sha") or c.get("hash") or ""
-            msg = (c.get("message") or c.get("commit", {}).get("message") or "").split("\n")[0][:160]
-            parts.append(f"\n- {sha} {msg}")
-            for f in (c.get("files") or [])[:30]:
+            msg = (c.get("message") or (c.get("commit") or _EMPTY_DICT).get("message") or "").partition("\n")[0][:160]
+            buf.write(f"\n\n- {sha} {msg}")
+            files = c.get("files") or ()
+            for f in files[:30]:
                 if isinstance(f, dict):
                     fn = f.get("filename") or ""
                     patch = f.get("patch") or ""
-                    parts.append(f"  * {fn}\n{patch[:4000]}")
-        return "\n".join(parts)
+                    buf.write(f"\n  * {fn}\n{_truncate_to_tokens(patch, _PATCH_TOKEN_LIMIT)}")
+                    if buf.tell() > char_cap:
+                        break
+        return buf.getvalue()
 
     def _build_chunked_context(
         self,
@@ -418,7 +605,6 @@ Return the same JSON format as before."""
         chunk_idx: int,
         total_chunks: int,
         file_contents: Dict[str, str],
-        repo_structure: Optional[Dict[str, Any]],
         previous_evaluation: Optional[Dict[str, Any]],
     ) -> str:
         parts = [f"CHUNK {chunk_idx}/{total_chunks}", ""]
@@ -426,38 +612,34 @@ Return the same JSON format as before."""
             parts.append("PREVIOUS EVALUATION (scores+reasoning):")
             parts.append(json.dumps(previous_evaluation, ensure_ascii=False)[:12000])
             parts.append("")
-        parts.append(self._build_commit_context(commits, username, file_contents=file_contents, repo_structure=repo_structure))
+        parts.append(self._build_commit_context(commits, username, file_contents=file_contents))
         return "\n".join(parts)
 
     def _load_relevant_files(self, commits: List[Dict[str, Any]]) -> Dict[str, str]:
         if not self.data_dir:
             return {}
-        files: List[str] = []
-        for c in commits:
-            for f in c.get("files") or []:
-                if isinstance(f, dict) and f.get("filename"):
-                    files.append(str(f["filename"]))
-        seen = set()
-        uniq: List[str] = []
-        for p in files:
-            if p in seen:
-                continue
-            seen.add(p)
-            uniq.append(p)
-        out: Dict[str, str] = {}
-        for rel in uniq[:25]:
-            if rel in self._file_cache:
-                out[rel] = self._file_cache[rel]
-                continue
-            abs_path = (self.data_dir / "files" / rel).resolve()
-            try:
-                if abs_path.exists() and abs_path.is_file():
-                    content = abs_path.read_text(encoding="utf-8", errors="ignore")
-                    self._file_cache[rel] = content
-                    out[rel] = content
-            except Exception:
-                continue
-        return out
+        # Rank by how many commits touched the file; nlargest keeps first appearance (commits
+        # are newest first, i.e. most recent touch) as the tie-break, like a stable sort would.
+        touches = self._commit_stats(commits)[0]
+        wanted: List[str] = heapq.nlargest(_MAX_FILES_IN_PROMPT, touches, key=touches.__getitem__)
+        missing = [rel for rel in wanted if rel not in self._file_cache]
+        if missing:
+            # Overlap the reads; results are stored on this thread.
+            with ThreadPoolExecutor(max_workers=min(_FILE_READ_WORKERS, len(missing))) as pool:
+                for rel, content in zip(missing, pool.map(self._read_repo_file, missing)):
+                    if content is not None:
+                        self._file_cache[rel] = content
+        return {rel: self._file_cache[rel] for rel in wanted if rel in self._file_cache}
+
+    def _read_repo_file(self, rel: str) -> Optional[str]:
+        abs_path = (self.data_dir / "files" / rel).resolve()
+        try:
+            if abs_path.is_file():
+                with open(abs_path, "r", encoding="utf-8", errors="ignore") as f:
+                    return f.read(_FILE_READ_CHARS)
+        except Exception:
+            pass
+        return None
 
     def _load_repo_structure(self) -> Optional[Dict[str, Any]]:
         if self._repo_structure is not None:
@@ -467,41 +649,54 @@ Return the same JSON format as before."""
         p = self.data_dir / "repo_structure.json"
         try:
             if p.exists():
-                self._repo_structure = json.loads(p.read_text(encoding="utf-8"))
+                raw = p.read_bytes()
+                self._repo_structure = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 return self._repo_structure
         except Exception:
             return None
         return None
 
-    def _evaluate_with_llm(self, context: str, username: str, chunk_idx: Optional[int] = None) -> Dict[str, Any]:
+    def _evaluate_with_llm(
+        self,
+        context: str,
+        username: str,
+        chunk_idx: Optional[int] = None,
+        *,
+        repo_structure: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+    ) -> Dict[str, Any]:
         allow_fallback = str(os.getenv("OSCANNER_ALLOW_FALLBACK") or "").strip().lower() in ("1", "true", "yes", "y")
         if not self.api_key:
             print("[ERROR] LLM API key not configured")
             if allow_fallback:
                 return self._fallback_evaluation(context)
             raise RuntimeError("LLM not configured (missing API key)")
-        prompt = self._build_evaluation_prompt(context, username, chunk_idx=chunk_idx)
-        print(f"[DEBUG] Prompt length: {len(prompt)} chars")
-        print(f"[DEBUG] Prompt sample (last 500 chars): {prompt[-500:]}")
+        static_prefix, suffix = self._build_evaluation_prompt(
+            context, username, chunk_idx=chunk_idx, repo_structure=repo_structure
+        )
+        print(f"[DEBUG] Prompt length: {len(static_prefix) + len(suffix)} chars (static prefix: {len(static_prefix)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            print(f"[DEBUG] Prompt sample (last 500 chars): {suffix[-500:]}")
 
         models_to_try = [self.model] + (self.fallback_models or [])
+        if model and model != self.model:
+            models_to_try.insert(0, model)
         last_err = None
         for m in models_to_try:
             try:
                 print(f"[LLM] Calling {m} at {self.api_url}")
                 print(f"[DEBUG] Request config: temperature=0.3, max_tokens=1500")
 
-                resp = requests.post(
-                    self.api_url,
-                    headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
-                    json={
+                # Serialize the prompt once; requests would otherwise re-encode it via stdlib json.
+                body = _dumps_bytes(
+                    {
                         "model": m,
-                        "messages": [{"role": "user", "content": prompt}],
+                        "messages": self._build_messages(m, static_prefix, suffix),
                         "temperature": 0.3,
                         "max_tokens": 1500,
-                    },
-                    timeout=90,
+                    }
                 )
+                resp = self._post_with_retry(body)
                 print(f"[DEBUG] API response status: {resp.status_code}")
 
                 if not resp.ok:
@@ -510,10 +705,13 @@ Return the same JSON format as before."""
                     continue
 
                 data = resp.json()
+                self._record_usage(data.get("usage"))
                 print(f"[DEBUG] Response JSON keys: {list(data.keys())}")
 
                 if "choices" not in data or not data["choices"]:
-                    print(f"[ERROR] No choices in API response: {data}")
+                    print("[ERROR] No choices in API response")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        print(f"[DEBUG] Response data: {str(data)[:500]}")
                     last_err = "No choices in response"
                     continue
 
@@ -524,13 +722,13 @@ Return the same JSON format as before."""
             except KeyError as e:
                 last_err = f"KeyError accessing response structure: {e}"
                 print(f"[ERROR] {last_err}")
-                print(f"[DEBUG] Response data: {str(data)[:500]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    print(f"[DEBUG] Response data: {str(data)[:500]}")
                 continue
             except Exception as e:
                 last_err = str(e)
                 print(f"[ERROR] LLM request failed for model {m}: {last_err}")
-                import traceback
-                print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+                logger.debug("LLM request failed for %s (model %s)", username, m, exc_info=True)
                 continue
 
         print(f"[ERROR] All LLM models failed. Last error: {last_err}")
@@ -539,19 +737,87 @@ Return the same JSON format as before."""
             return self._fallback_evaluation(context)
         raise RuntimeError(f"LLM request failed for all models. last_error={last_err}")
 
+    def _post_with_retry(self, body: bytes) -> requests.Response:
+        """POST to the LLM API, retrying connection errors, timeouts and transient HTTP statuses."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+        }
+        for attempt in range(1, _LLM_MAX_ATTEMPTS + 1):
+            retry_after: Optional[float] = None
+            try:
+                resp = self._session.post(self.api_url, headers=headers, data=body, timeout=90)
+                if resp.status_code not in _RETRYABLE_STATUS or attempt == _LLM_MAX_ATTEMPTS:
+                    return resp
+                reason = f"HTTP {resp.status_code}"
+                try:
+                    retry_after = float(resp.headers.get("Retry-After", ""))
+                except ValueError:
+                    retry_after = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == _LLM_MAX_ATTEMPTS:
+                    raise
+                reason = type(e).__name__
+            delay = random.uniform(0, min(_LLM_BACKOFF_MAX_S, _LLM_BACKOFF_BASE_S * (2 ** (attempt - 1))))
+            if retry_after is not None:
+                delay = min(_LLM_BACKOFF_MAX_S, max(delay, retry_after))
+            print(f"[LLM] Transient failure ({reason}), retry {attempt}/{_LLM_MAX_ATTEMPTS - 1} in {delay:.1f}s")
+            time.sleep(delay)
+        raise RuntimeError("unreachable")
+
+    def _record_usage(self, usage: Any) -> None:
+        if not isinstance(usage, dict):
+            usage = _EMPTY_DICT
+        with self._usage_lock:
+            self._llm_usage["calls"] += 1
+            self._llm_usage["prompt_tokens"] += int(usage.get("prompt_tokens") or 0)
+            self._llm_usage["completion_tokens"] += int(usage.get("completion_tokens") or 0)
+            # OpenRouter reports the billed USD amount per request; other providers may not.
+            self._llm_usage["cost"] += float(usage.get("cost") or 0.0)
+
     def _estimate_tokens(self, text: str) -> int:
-        return max(1, len(text) // 4)
+        return _count_tokens(text)
 
     def _truncate_context(self, context: str, max_tokens: int) -> str:
         cur = self._estimate_tokens(context)
         if cur <= max_tokens:
             return context
-        target_chars = max_tokens * 4
-        return context[:target_chars] + "\n\n[... Context truncated ...]"
-
-    def _build_evaluation_prompt(self, context: str, username: str, chunk_idx: Optional[int] = None) -> str:
+        return _truncate_to_tokens(context, max_tokens) + "\n\n[... Context truncated ...]"
+
+    def _repo_block(self, repo_structure: Optional[Dict[str, Any]]) -> Tuple[str, int]:
+        """Serialized repo-structure prompt block and its token count, memoized per structure."""
+        if not repo_structure:
+            return "", 0
+        memo = self._repo_block_memo
+        if memo is not None and memo[0] is repo_structure:
+            return memo[1], memo[2]
+        # sort_keys keeps the serialized prefix byte-stable across runs.
+        repo_json = json.dumps(repo_structure, ensure_ascii=False, sort_keys=True)[:8000]
+        repo_block = f"\n\nREPO STRUCTURE (truncated):\n{repo_json}"
+        tokens = self._estimate_tokens(repo_block)
+        self._repo_block_memo = (repo_structure, repo_block, tokens)
+        return repo_block, tokens
+
+    def _build_evaluation_prompt(
+        self,
+        context: str,
+        username: str,
+        chunk_idx: Optional[int] = None,
+        *,
+        repo_structure: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, str]:
+        """
+        Build the prompt as (static_prefix, suffix).
+
+        The prefix (instructions, rubric, dimensions, output format, then the shared repo
+        structure) is byte-identical for every user of this evaluator, so providers with prompt
+        caching can reuse it; everything that varies per call (user, chunk, previous scores,
+        data) goes into the suffix.
+        """
+        repo_block, repo_block_tokens = self._repo_block(repo_structure)
         prompt_template_tokens = 900
-        max_context_tokens = self.max_input_tokens - prompt_template_tokens
+        max_context_tokens = self.max_input_tokens - prompt_template_tokens - repo_block_tokens
         context = self._truncate_context(context, max_context_tokens)
 
         is_chinese = self.language == "zh-CN"
@@ -567,7 +833,8 @@ Return the same JSON format as before."""
 
         # Language-specific instructions
         if is_chinese:
-            base_instruction = f'你是一位专业的工程能力评估员。分析用户 "{username}" 的数据，并对每个维度评分（0-100分）。'
+            base_instruction = "你是一位专业的工程能力评估员。分析下方指定用户的数据，并对每个维度评分（0-100分）。"
+            user_line = f'用户："{username}"'
             mode_note = ""
             if self.mode == "moderate":
                 mode_note = "\n注意：你可能会看到提交差异（commit diffs）和文件内容。在有帮助的情况下请使用文件内容。"
@@ -578,7 +845,8 @@ Return the same JSON format as before."""
             dimensions_label = "评估维度"
             return_json_instruction = "仅返回有效的JSON格式"
         else:
-            base_instruction = f'You are an expert engineering evaluator. Analyze data from user "{username}" and score each dimension 0-100.'
+            base_instruction = "You are an expert engineering evaluator. Analyze the data from the user named below and score each dimension 0-100."
+            user_line = f'USER: "{username}"'
             mode_note = ""
             if self.mode == "moderate":
                 mode_note = "\nNOTE: You may see both commit diffs AND file contents. Use file contents when helpful."
@@ -613,16 +881,29 @@ Return the same JSON format as before."""
             format_note = "Each dimension: score 0-100"
 
         # Create proper valid JSON example
-        fmt_example = {k: 0 for k in self.dimensions.keys()}
+        fmt_example = {k: 0 for k in _DIMENSION_KEYS}
         fmt_example["reasoning"] = reasoning_example
         fmt_text = json.dumps(fmt_example, ensure_ascii=False, indent=2)
         fmt_text_with_note = f"{format_note}\n\n{fmt_text}"
 
-        return (
-            f'{base_instruction}'
-            f"{mode_note}{chunked_instruction}{rubric_block}{previous_scores_block}\n\n{data_label}:\n{context}\n\n{dimensions_label}:\n{dims_text}\n\n"
-            f"{return_json_instruction}:\n{fmt_text_with_note}"
+        static_prefix = (
+            f"{base_instruction}{mode_note}{rubric_block}\n\n{dimensions_label}:\n{dims_text}\n\n"
+            f"{return_json_instruction}:\n{fmt_text_with_note}{repo_block}"
         )
+        suffix = f"{user_line}{chunked_instruction}{previous_scores_block}\n\n{data_label}:\n{context}"
+        return static_prefix, suffix
+
+    def _build_messages(self, model: str, static_prefix: str, suffix: str) -> List[Dict[str, Any]]:
+        if not _supports_prompt_cache(model):
+            return [{"role": "system", "content": static_prefix}, {"role": "user", "content": suffix}]
+        # Explicit breakpoint: Anthropic (incl. via OpenRouter) bills cached prefix reads at ~10%.
+        return [
+            {
+                "role": "system",
+                "content": [{"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}}],
+            },
+            {"role": "user", "content": [{"type": "text", "text": suffix}]},
+        ]
 
     def _parse_llm_response(self, content: str) -> Dict[str, Any]:
         try:
@@ -649,11 +930,8 @@ Return the same JSON format as before."""
             data = json.loads(json_str)
             print(f"[DEBUG] JSON parsed successfully, keys: {list(data.keys())}")
 
-            out: Dict[str, Any] = {}
-            for k in self.dimensions.keys():
-                score_val = data.get(k, 0)
-                out[k] = min(100, max(0, int(score_val)))
-                print(f"[DEBUG] Dimension {k}: {score_val} -> {out[k]}")
+            out: Dict[str, Any] = {k: min(100, max(0, int(data.get(k, 0)))) for k in _DIMENSION_KEYS}
+            print(f"[DEBUG] Dimension scores: {out}")
 
             if "reasoning" in data:
                 out["reasoning"] = self._format_reasoning(str(data["reasoning"]))
@@ -674,7 +952,7 @@ Return the same JSON format as before."""
 
         # Fallback with reasoning
         print("[FALLBACK] Using default scores due to parsing failure")
-        fallback = {k: 50 for k in self.dimensions.keys()}
+        fallback = {k: 50 for k in _DIMENSION_KEYS}
         fallback["reasoning"] = "**Error:** LLM response parsing failed. Using default scores."
         return fallback
 
@@ -684,7 +962,7 @@ Return the same JSON format as before."""
 
     def _merge_evaluations(self, prev: Dict[str, Any], new: Dict[str, Any], chunk_idx: int) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
-        for k in self.dimensions.keys():
+        for k in _DIMENSION_KEYS:
             out[k] = int(round((int(prev.get(k, 0)) + int(new.get(k, 0))) / 2))
         # Use the new reasoning which already consolidates previous + new evidence
         nr = str(new.get("reasoning", "")).strip()
@@ -693,27 +971,13 @@ Return the same JSON format as before."""
         return out
 
     def _fallback_evaluation(self, context: str) -> Dict[str, Any]:
-        text = (context or "").lower()
-
-        def score_by_keywords(keywords: List[str]) -> int:
-            hits = sum(1 for kw in keywords if kw in text)
-            if not keywords:
-                return 0
-            return min(100, int((hits / len(keywords)) * 100))
-
-        # Heuristic keywords tuned toward engineer_level.md signals
-        kw = {
-            "ai_fullstack": ["refactor", "test", "lint", "type", "validation", "error", "edge", "bugfix"],
-            "ai_architecture": ["architecture", "adr", "design", "interface", "module", "boundary", "migration", "trade-off"],
-            "cloud_native": ["docker", "compose", "kubernetes", "deploy", "ci", "cd", "terraform", "devcontainer"],
-            "open_source": ["pr", "review", "issue", "docs", "changelog", "release", "discussion", "community"],
-            "intelligent_dev": ["automation", "script", "tool", "agent", "prompt", "eval", "dataset", "trace"],
-            "leadership": ["security", "performance", "optimize", "reliability", "incident", "standard", "best practice"],
-        }
+        found = _find_fallback_keywords((context or "").lower())
 
         scores: Dict[str, Any] = {}
-        for k in self.dimensions.keys():
-            scores[k] = score_by_keywords(kw.get(k, []))
+        for k in _DIMENSION_KEYS:
+            keywords = _FALLBACK_KEYWORDS.get(k, ())
+            hits = sum(1 for kw in keywords if kw in found)
+            scores[k] = min(100, int((hits / len(keywords)) * 100)) if keywords else 0
 
         scores["reasoning"] = (
             "**Note:** LLM not available or failed; using rubric-flavored keyword heuristic scoring.\n\n"
@@ -723,31 +987,43 @@ Return the same JSON format as before."""
         )
         return scores
 
-    def _summarize_commits(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _commit_stats(self, commits: List[Dict[str, Any]]) -> Tuple[Dict[str, int], int, int]:
+        """
+        One pass over commits: per-file touch counts (first-appearance order), total additions
+        and total deletions. Memoized per commit list, since the relevant-files loader and the
+        summary both walk the same author commit list.
+        """
+        memo = self._commit_stats_memo
+        if memo is not None and memo[0] is commits:
+            return memo[1]
+        touches: Dict[str, int] = {}
         total_additions = 0
         total_deletions = 0
-        files_changed = set()
-        languages = set()
-        for commit in commits:
-            stats = commit.get("stats", {}) if isinstance(commit.get("stats"), dict) else {}
-            total_additions += int(stats.get("additions", 0) or 0)
-            total_deletions += int(stats.get("deletions", 0) or 0)
-            for fi in commit.get("files") or []:
-                if isinstance(fi, dict):
-                    fn = fi.get("filename") or ""
-                    if fn:
-                        files_changed.add(fn)
-                        if "." in fn:
-                            languages.add(fn.rsplit(".", 1)[-1])
+        for c in commits:
+            stats = c.get("stats")
+            if isinstance(stats, dict):
+                total_additions += int(stats.get("additions", 0) or 0)
+                total_deletions += int(stats.get("deletions", 0) or 0)
+            for f in c.get("files") or ():
+                if isinstance(f, dict) and f.get("filename"):
+                    fn = str(f["filename"])
+                    touches[fn] = touches.get(fn, 0) + 1
+        result = (touches, total_additions, total_deletions)
+        self._commit_stats_memo = (commits, result)
+        return result
+
+    def _summarize_commits(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        files_changed, total_additions, total_deletions = self._commit_stats(commits)
+        languages = {fn.rpartition(".")[2] for fn in files_changed if "." in fn}
         return {
             "total_additions": total_additions,
             "total_deletions": total_deletions,
             "files_changed": len(files_changed),
-            "languages": list(languages)[:10],
+            "languages": list(islice(languages, 10)),
         }
 
     def _get_empty_evaluation(self, username: str) -> Dict[str, Any]:
-        scores = {k: 0 for k in self.dimensions.keys()}
+        scores = {k: 0 for k in _DIMENSION_KEYS}
         scores["reasoning"] = "No commits found for this user in the analyzed data."
         return {
             "username": username,